@@ -205,13 +205,14 @@ class AxisExtractor:
     با دو اولویت جستجو: AXIS[19-45] و سپس S[19-45]
     """
 
-    def __init__(self, config: PMSConfig = PMSConfig()):
+    def __init__(self, config: Optional[PMSConfig] = None):
         """
         مقداردهی اولیه
 
         Args:
-            config: تنظیمات برنامه
+            config: تنظیمات برنامه (پیش‌فرض: PMSConfig)
         """
+        config = config or PMSConfig()
         self.config = config
         self.normalizer = TextNormalizer()
 
@@ -366,13 +367,14 @@ class PMSStructureReader:
     کلاس خواندن و استخراج ساختار سلسله‌مراتبی PMS
     """
 
-    def __init__(self, config: PMSConfig = PMSConfig()):
+    def __init__(self, config: Optional[PMSConfig] = None):
         """
         مقداردهی اولیه
 
         Args:
-            config: تنظیمات برنامه
+            config: تنظیمات برنامه (پیش‌فرض: PMSConfig)
         """
+        config = config or PMSConfig()
         self.config = config
         self.normalizer = TextNormalizer()
         self.hierarchy_searcher = PMSHierarchySearcher(config)
@@ -452,13 +454,14 @@ class PMSHierarchySearcher:
     کلاس جستجوی سلسله‌مراتبی در ساختار outline PMS
     """
 
-    def __init__(self, config: PMSConfig = PMSConfig()):
+    def __init__(self, config: Optional[PMSConfig] = None):
         """
         مقداردهی اولیه
 
         Args:
-            config: تنظیمات برنامه
+            config: تنظیمات برنامه (پیش‌فرض: PMSConfig)
         """
+        config = config or PMSConfig()
         self.config = config
 
     @staticmethod
@@ -620,13 +623,14 @@ class PNTItemExtractor:
     کلاس استخراج آیتم‌ها از فایل PNT-G
     """
 
-    def __init__(self, config: PMSConfig = PMSConfig()):
+    def __init__(self, config: Optional[PMSConfig] = None):
         """
         مقداردهی اولیه
 
         Args:
-            config: تنظیمات برنامه
+            config: تنظیمات برنامه (پیش‌فرض: PMSConfig)
         """
+        config = config or PMSConfig()
         self.config = config
         self.normalizer = TextNormalizer()
         self.axis_extractor = AxisExtractor(config)
@@ -743,13 +747,14 @@ class UpdatePlanner:
     کلاس برنامه‌ریزی و تطابق آیتم‌های PNT با PMS
     """
 
-    def __init__(self, config: PMSConfig = PMSConfig()):
+    def __init__(self, config: Optional[PMSConfig] = None):
         """
         مقداردهی اولیه
 
         Args:
-            config: تنظیمات برنامه
+            config: تنظیمات برنامه (پیش‌فرض: PMSConfig)
         """
+        config = config or PMSConfig()
         self.config = config
         self.hierarchy_searcher = PMSHierarchySearcher(config)
 
@@ -958,13 +963,14 @@ class COMUpdater:
     کلاس به‌روزرسانی فایل Excel با استفاده از win32com
     """
 
-    def __init__(self, config: PMSConfig = PMSConfig()):
+    def __init__(self, config: Optional[PMSConfig] = None):
         """
         مقداردهی اولیه
 
         Args:
-            config: تنظیمات برنامه
+            config: تنظیمات برنامه (پیش‌فرض: PMSConfig)
         """
+        config = config or PMSConfig()
         self.config = config
 
     def update_file(self, file_path: str, sheet_name: str, updates: List[Dict]):
@@ -1256,13 +1262,14 @@ class PMSUpdateOrchestrator:
     کلاس هماهنگی کل فرآیند به‌روزرسانی PMS از PNT-G
     """
 
-    def __init__(self, config: PMSConfig = PMSConfig()):
+    def __init__(self, config: Optional[PMSConfig] = None):
         """
         مقداردهی اولیه
 
         Args:
-            config: تنظیمات برنامه
+            config: تنظیمات برنامه (پیش‌فرض: PMSConfig)
         """
+        config = config or PMSConfig()
         self.config = config
         self.cache_manager = PMSCacheManager(config.CACHE_FILE)
         self.structure_reader = PMSStructureReader(config)
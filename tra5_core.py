@@ -1,14 +1,44 @@
 import openpyxl
-from openpyxl.worksheet.worksheet import Worksheet
 import re
+import unicodedata
 import json
+import logging
 import os
+import zipfile
+import hashlib
+from copy import deepcopy
 from datetime import datetime
-import win32com.client
+from array import array
+from bisect import bisect_left
+from collections import namedtuple
+from functools import lru_cache
+from itertools import groupby
 from pathlib import Path
 from typing import List, Dict, Optional, Tuple, Any
 
-import json
+# win32com فقط در ویندوز (با Excel نصب شده) در دسترس است
+try:
+    import pythoncom
+    import win32com.client
+except ImportError:
+    pythoncom = None
+    win32com = None
+
+# orjson (اختیاری) برای (de)serialize سریع‌تر cache
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# WorkSheetParser بخشی از API داخلی openpyxl است (تست شده با 3.1.5)؛ در نبود آن
+# snapshot شیت PMS با load_workbook معمولی خوانده می‌شود
+try:
+    from openpyxl.worksheet._reader import WorkSheetParser
+except ImportError:
+    WorkSheetParser = None
+
+# traceback خطاها با logger.exception ثبت می‌شود (handler در main() تنظیم می‌شود)
+logger = logging.getLogger(__name__)
 
 
 # ================================================================================
@@ -63,20 +93,41 @@ class ConfigLoader:
             f"   - config.env (سازگاری با نسخه قدیم)"
         )
 
+    @staticmethod
+    def _file_key(file_path: str) -> Tuple[str, int, int]:
+        """کلید cache فایل: مسیر مطلق + زمان تغییر + اندازه"""
+        stat = os.stat(file_path)
+        return os.path.abspath(file_path), stat.st_mtime_ns, stat.st_size
+
     @staticmethod
     def _load_json_file(file_path: str) -> Dict[str, Any]:
         """بارگذاری فایل JSON"""
+        # کپی مستقل تا تغییر دیکشنری برگشتی روی نسخه cache اثر نگذارد
+        config = deepcopy(ConfigLoader._parse_json_file(*ConfigLoader._file_key(file_path)))
+        print(f"✅ تنظیمات از {file_path} بارگذاری شد")
+        return config
+
+    @staticmethod
+    @lru_cache(maxsize=4)
+    def _parse_json_file(file_path: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+        """پارس فایل JSON (mtime_ns و size فقط برای باطل شدن cache هستند)"""
         try:
             with open(file_path, 'r', encoding='utf-8') as f:
-                config = json.load(f)
-            print(f"✅ تنظیمات از {file_path} بارگذاری شد")
-            return config
+                return json.load(f)
         except json.JSONDecodeError as e:
             raise ValueError(f"❌ خطا در خواندن JSON از {file_path}: {e}")
 
     @staticmethod
     def _load_env_file(file_path: str) -> Dict[str, Any]:
         """بارگذاری فایل ENV"""
+        config = deepcopy(ConfigLoader._parse_env_file(*ConfigLoader._file_key(file_path)))
+        print(f"✅ تنظیمات از {file_path} بارگذاری شد (ENV format)")
+        return config
+
+    @staticmethod
+    @lru_cache(maxsize=4)
+    def _parse_env_file(file_path: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+        """پارس فایل ENV (mtime_ns و size فقط برای باطل شدن cache هستند)"""
         config = {}
 
         with open(file_path, 'r', encoding='utf-8') as f:
@@ -102,7 +153,6 @@ class ConfigLoader:
 
                     config[key] = value
 
-        print(f"✅ تنظیمات از {file_path} بارگذاری شد (ENV format)")
         return config
 
     @staticmethod
@@ -234,6 +284,8 @@ class PMSConfig:
             self.ROW_END = 31
 
     class _PMSConfig:
+        __slots__ = ('TEXT_COL', 'DATE_COL', 'G_COL', 'N_COL')
+
         def __init__(self, config):
             if 'text' in config:  # JSON
                 self.TEXT_COL = config['text']
@@ -270,10 +322,59 @@ class PMSConfig:
             ]
 
 
+# ================================================================================
+# 📦 رکوردهای داده
+# ================================================================================
+
+# آیتم سطح هدف یافت شده در ساختار PMS
+ItemRecord = namedtuple('ItemRecord', 'row level text')
+
+# یک سطر آیتم خوانده شده از PNT-G
+PNTItem = namedtuple('PNTItem', 'pnt_row quantity m_value original single_line normalized axis')
+
+
+def _format_preview(header: str, items: List, format_item, limit: int = 5) -> str:
+    """
+    ساخت یک پیام چندخطی: عنوان + limit مورد اول + تعداد باقیمانده
+
+    Args:
+        header: سطر عنوان
+        items: لیست کامل موارد
+        format_item: تابع تبدیل هر مورد به یک سطر
+        limit: حداکثر موارد نمایش داده شده
+
+    Returns:
+        متن پیام برای یک فراخوانی log_callback
+    """
+    parts = [header]
+    parts.extend(format_item(item) for item in items[:limit])
+    if len(items) > limit:
+        parts.append(f"   ... و {len(items) - limit} مورد دیگر")
+    return '\n'.join(parts)
+
+
 # ================================================================================
 # 🔧 ماژول نرمال‌سازی متن
 # ================================================================================
 
+# الگوهای regex یک بار در سطح ماژول کامپایل می‌شوند
+# "شماره صورت مجلس" با یا بدون فاصله (صورتمجلس)
+_RE_SOROOMJELES = re.compile(r'شماره\s*صورت\s*مجلس', re.IGNORECASE)
+_RE_WS = re.compile(r'\s+')
+
+# یکسان‌سازی حروف عربی (ي/ك) با فارسی (ی/ک) و حذف نیم‌فاصله (ZWNJ)
+_CHAR_MAP = str.maketrans({'\u064a': '\u06cc', '\u0643': '\u06a9', '\u200c': None})
+
+
+# نرمال‌سازها توابع خالص str -> str هستند؛ ورودی‌های تکراری از cache برمی‌گردند
+# (اندازه cache برای تمام متن‌های یکتای یک شیت PMS بزرگ کافی است)
+@lru_cache(maxsize=65536)
+def _normalize_standard(text: str) -> str:
+    # NFKC شکل‌های نمایشی (presentation forms) عربی/فارسی و تمام‌عرض را یکسان می‌کند
+    text = unicodedata.normalize('NFKC', text).translate(_CHAR_MAP)
+    return _RE_WS.sub('', text).casefold()
+
+
 class TextNormalizer:
     """
     کلاس نرمال‌سازی متن
@@ -298,9 +399,8 @@ class TextNormalizer:
 
         text = str(text).strip()
 
-        # حذف عبارت "شماره صورتمجلس" (با حروف مختلف ی/ی و ک/ک)
-        text = re.sub(r'شماره\s*صورت\s*مجلس', '', text, flags=re.IGNORECASE)
-        text = re.sub(r'شماره\s*صورتمجلس', '', text, flags=re.IGNORECASE)
+        # حذف عبارت "شماره صورتمجلس"
+        text = _RE_SOROOMJELES.sub('', text)
 
         # حذف فاصله‌های اضافی
         text = ' '.join(text.split())
@@ -311,22 +411,18 @@ class TextNormalizer:
     def normalize_standard(text: Optional[str]) -> str:
         """
         نرمال‌سازی استاندارد برای متن فارسی
+        (کلید مشترک تطابق آیتم‌های PMS و PNT)
 
         Args:
             text: متن ورودی
 
         Returns:
-            متن نرمال‌شده (lowercase, بدون فاصله)
+            متن نرمال‌شده (NFKC, casefold, بدون فاصله و نیم‌فاصله)
         """
         if text is None:
             return ""
 
-        text = str(text).strip()
-        text = text.replace('ی', 'ی').replace('ک', 'ک')
-        text = re.sub(r'\s+', '', text)
-        text = text.lower()
-
-        return text
+        return _normalize_standard(str(text))
 
     @staticmethod
     def normalize_pnt_axis(text: Optional[str]) -> str:
@@ -371,18 +467,18 @@ class TextNormalizer:
         if text is None:
             return ""
 
-        text = str(text)
-        # تبدیل خطوط به فاصله
-        text = text.replace('\n', ' ').replace('\r', ' ')
-        # حذف فاصله‌های متوالی
-        text = ' '.join(text.split())
-
-        return text.strip()
+        # split() بدون آرگومان \n و \r را هم جداکننده حساب می‌کند و
+        # فاصله‌های ابتدا/انتها را حذف می‌کند؛ یک عبور بدون رشته‌های میانی
+        return ' '.join(str(text).split())
 
 # ================================================================================
 # 🔧 ماژول استخراج محور
 # ================================================================================
 
+# پیشوند AXIS یا S، فاصله/خط‌تیره اختیاری و شماره دو رقمی محور
+_RE_AXIS = re.compile(r'(AXIS|S)[\s\-]*(\d{2})')
+
+
 class AxisExtractor:
     """
     کلاس استخراج شماره محور از سطرهای PNT-G
@@ -398,57 +494,60 @@ class AxisExtractor:
         """
         self.config = config
         self.normalizer = TextNormalizer()
+        # بازه معتبر محورها (بررسی عضویت range در O(1) انجام می‌شود)
+        self._axis_range = range(config.AXIS_RANGE_START, config.AXIS_RANGE_END)
 
-    def extract_from_row(self, ws: Worksheet, row_idx: int) -> Optional[int]:
+    def extract_from_values(self, values) -> Optional[int]:
         """
-        استخراج شماره محور از یک سطر PNT-G
+        استخراج شماره محور از مقادیر ستون‌های جستجو
 
-        جستجو در ستون‌های مشخص شده با دو اولویت:
+        جستجو با دو اولویت:
         1. AXIS[19-45]
         2. S[19-45]
 
         Args:
-            ws: worksheet PNT-G
-            row_idx: شماره سطر
+            values: مقادیر ستون‌های AXIS_SEARCH_COLS به همان ترتیب
 
         Returns:
             شماره محور (19-45) یا None
         """
-        # اولویت 1: جستجوی AXIS[19-45]
-        mohor = self._search_pattern(ws, row_idx, "AXIS")
-        if mohor:
-            return mohor
-
-        # اولویت 2: جستجوی S[19-45]
-        mohor = self._search_pattern(ws, row_idx, "S")
-        return mohor
-
-    def _search_pattern(self, ws: Worksheet, row_idx: int, pattern_prefix: str) -> Optional[int]:
-        """
-        جستجوی الگو در ستون‌های مشخص
-
-        Args:
-            ws: worksheet
-            row_idx: شماره سطر
-            pattern_prefix: پیشوند الگو (AXIS یا S)
+        s_match = None
 
-        Returns:
-            شماره محور یا None
-        """
-        for col in self.config.PNT.AXIS_SEARCH_COLS:
-            cell_value = ws.cell(row_idx, col).value
+        for cell_value in values:
             if not cell_value:
                 continue
 
-            normalized = self.normalizer.normalize_pnt_axis(cell_value)
+            text = str(cell_value).upper()
+
+            # هر دو پیشوند شامل حرف S هستند؛ سلول بدون S (مثلا عدد) نیازی به regex ندارد
+            if 'S' not in text:
+                continue
 
-            for mohor_num in range(self.config.AXIS_RANGE_START,
-                                   self.config.AXIS_RANGE_END):
-                pattern = f"{pattern_prefix}{mohor_num}"
-                if pattern in normalized:
+            for prefix, mohor_num in self._search_pattern(text):
+                # اولویت 1: AXIS[19-45] در هر ستونی برنده است
+                if prefix == "AXIS":
                     return mohor_num
+                # اولویت 2: اولین S[19-45] به عنوان جایگزین
+                if s_match is None:
+                    s_match = mohor_num
 
-        return None
+        return s_match
+
+    def _search_pattern(self, text: str):
+        """
+        استخراج تطابق‌های معتبر الگوی محور از یک متن (یک پیمایش regex)
+
+        Args:
+            text: متن uppercase سلول
+
+        Yields:
+            (پیشوند, شماره محور) برای هر تطابق در بازه محورها
+        """
+        axis_range = self._axis_range
+        for match in _RE_AXIS.finditer(text):
+            mohor_num = int(match.group(2))
+            if mohor_num in axis_range:
+                yield match.group(1), mohor_num
 
 # ================================================================================
 # 💾 ماژول مدیریت Cache
@@ -457,6 +556,9 @@ class AxisExtractor:
 class PMSCacheManager:
     """کلاس مدیریت cache ساختار PMS"""
 
+    # نسخه ساختار item_locations؛ cache با نسخه متفاوت نادیده گرفته می‌شود
+    CACHE_VERSION = 4
+
     def __init__(self, cache_file: str, log_callback=None):
         self.cache_file = cache_file
         self.log_callback = log_callback or print
@@ -467,12 +569,15 @@ class PMSCacheManager:
             return None
 
         try:
-            with open(self.cache_file, 'r', encoding='utf-8') as f:
-                cache_data = json.load(f)
+            with open(self.cache_file, 'rb') as f:
+                raw = f.read()
+
+            cache_data = orjson.loads(raw) if orjson is not None else json.loads(raw)
 
             current_hash = self.get_file_hash(file_path)
 
-            if (cache_data.get('file_hash') == current_hash and
+            if (cache_data.get('version') == self.CACHE_VERSION and
+                    cache_data.get('file_hash') == current_hash and
                     cache_data.get('sheet_name') == sheet_name):
                 return cache_data['item_locations']
         except Exception as e:
@@ -488,14 +593,20 @@ class PMSCacheManager:
                 os.makedirs(cache_dir)
 
             cache_data = {
+                'version': self.CACHE_VERSION,
                 'file_hash': self.get_file_hash(file_path),
                 'sheet_name': sheet_name,
                 'timestamp': datetime.now().isoformat(),
                 'item_locations': item_locations
             }
 
-            with open(self.cache_file, 'w', encoding='utf-8') as f:
-                json.dump(cache_data, f, ensure_ascii=False, indent=2)
+            if orjson is not None:
+                raw = orjson.dumps(cache_data)
+            else:
+                raw = json.dumps(cache_data, ensure_ascii=False).encode('utf-8')
+
+            with open(self.cache_file, 'wb') as f:
+                f.write(raw)
 
             self.log_callback(f"💾 Cache ذخیره شد: {self.cache_file}", "info")
         except Exception as e:
@@ -504,7 +615,12 @@ class PMSCacheManager:
     @staticmethod
     def get_file_hash(file_path: str) -> str:
         """
-        محاسبه hash ساده بر اساس modified time و size
+        محاسبه hash بر اساس محتوای فایل xlsx
+
+        فایل xlsx یک ZIP است و CRC32 هر بخش در central directory آن ذخیره
+        شده؛ hash (BLAKE2b) از نام، CRC و اندازه بخش‌ها ساخته می‌شود، پس فقط انتهای فایل خوانده
+        می‌شود و ذخیره/touch بدون تغییر محتوا cache را باطل نمی‌کند.
+        برای فایل غیر ZIP از BLAKE2b کل محتوای فایل استفاده می‌شود.
 
         Args:
             file_path: مسیر فایل
@@ -512,8 +628,18 @@ class PMSCacheManager:
         Returns:
             hash string
         """
-        stat = os.stat(file_path)
-        return f"{stat.st_mtime}_{stat.st_size}"
+        try:
+            digest = hashlib.blake2b(digest_size=16)
+            with zipfile.ZipFile(file_path) as zf:
+                for info in zf.infolist():
+                    digest.update(f"{info.filename}\0{info.CRC}\0{info.file_size}\n".encode('utf-8'))
+            return f"zip_{digest.hexdigest()}"
+        except zipfile.BadZipFile:
+            digest = hashlib.blake2b(digest_size=16)
+            with open(file_path, 'rb') as f:
+                for chunk in iter(lambda: f.read(1 << 20), b''):
+                    digest.update(chunk)
+            return f"b2_{digest.hexdigest()}"
 
 # ================================================================================
 # 📊 ماژول خواندن ساختار PMS
@@ -530,7 +656,7 @@ class PMSStructureReader:
 
 
 
-    def extract_all_items(self, file_path: str, sheet_name: str) -> Dict[str, List[Dict]]:
+    def extract_all_items(self, file_path: str, sheet_name: str) -> Dict[str, Dict[str, List[int]]]:
         """
         استخراج تمام آیتم‌های Level 5 از همه محورها
 
@@ -539,30 +665,25 @@ class PMSStructureReader:
             sheet_name: نام شیت
 
         Returns:
-            دیکشنری: {normalized_item: [{'mohor': ..., 'row': ..., 'level': ...}]}
+            دیکشنری: {normalized_item: {mohor_name: [row, ...]}}
+            (همه آیتم‌ها در سطح TARGET_LEVEL هستند؛ فقط شماره سطر نگه داشته می‌شود)
         """
         self.log_callback("🔄 در حال استخراج ساختار PMS...", "info")
 
         # جستجو در تمام محورها
         mohor_results = self._search_all_mohors(file_path, sheet_name)
 
-        # تبدیل به فرمت دیکشنری برای جستجوی سریع
+        # تبدیل به index دو سطحی (آیتم -> محور) برای جستجوی مستقیم
         item_locations = {}
         for mohor_name, items in mohor_results.items():
             for item in items:
-                normalized_text = self.normalizer.normalize_standard(item['text'])
-                if normalized_text not in item_locations:
-                    item_locations[normalized_text] = []
-                item_locations[normalized_text].append({
-                    'mohor': mohor_name,
-                    'row': item['row'],
-                    'level': item['level'],
-                    'original_text': item['text']
-                })
+                normalized_text = self.normalizer.normalize_standard(item.text)
+                by_mohor = item_locations.setdefault(normalized_text, {})
+                by_mohor.setdefault(mohor_name, []).append(item.row)
 
         return item_locations
 
-    def _search_all_mohors(self, file_path: str, sheet_name: str) -> Dict[str, List[Dict]]:
+    def _search_all_mohors(self, file_path: str, sheet_name: str) -> Dict[str, List[ItemRecord]]:
         """
         جستجوی سلسله‌مراتبی در تمام محورها
 
@@ -573,26 +694,23 @@ class PMSStructureReader:
         Returns:
             دیکشنری: {mohor_name: [items]}
         """
-        wb = openpyxl.load_workbook(file_path, data_only=False)
-        ws = wb[sheet_name]
-
-        all_results = {}
+        # یک بار خواندن ستون متن و outline level، سپس جستجو روی لیست‌های حافظه
+        text_col, outline_level = self.hierarchy_searcher.load_sheet_snapshot(file_path, sheet_name)
 
-        for mohor_num in range(self.config.AXIS_RANGE_START,
-                               self.config.AXIS_RANGE_END):
-            mohor_name = f"محور {mohor_num}"
-            search_path = self.config.Hierarchy.get_search_path(mohor_num)
+        # جستجوی همه محورها در یک عبور
+        results_by_axis = self.hierarchy_searcher.find_items_multi(
+            text_col,
+            outline_level,
+            range(self.config.AXIS_RANGE_START, self.config.AXIS_RANGE_END),
+            self.config.Hierarchy.TARGET_LEVEL
+        )
 
-            results = self.hierarchy_searcher.find_items(
-                ws,
-                search_path,
-                self.config.Hierarchy.TARGET_LEVEL
-            )
+        all_results = {}
 
+        for mohor_num, results in results_by_axis.items():
             if results:
-                all_results[mohor_name] = results
+                all_results[f"محور {mohor_num}"] = results
 
-        wb.close()
         return all_results
 
 # ================================================================================
@@ -612,115 +730,271 @@ class PMSHierarchySearcher:
             config: تنظیمات برنامه
         """
         self.config = config
+        # cache خروجی load_sheet_snapshot: (مسیر, شیت) -> (hash فایل, text_col, outline_level)
+        self._snapshot_cache: Dict[Tuple[str, str], Tuple[str, List[Optional[str]], array]] = {}
+        # index سطرها به تفکیک سطح برای آخرین outline_level: (outline_level, index)
+        self._level_index: Optional[Tuple[array, Dict[int, List[int]]]] = None
 
-    @staticmethod
-    def get_outline_level(row) -> int:
+    def release(self):
+        """آزاد کردن snapshot های cache شده و index سطرها به تفکیک سطح"""
+        self._snapshot_cache.clear()
+        self._level_index = None
+
+    def load_sheet_snapshot(self, file_path: str, sheet_name: str) -> Tuple[List[Optional[str]], array]:
         """
-        دریافت outline level یک سطر
+        خواندن یک‌باره ستون متن و outline level تمام سطرها (حالت read-only)
+
+        در حالت read-only، openpyxl سطرها را به صورت streaming می‌خواند اما
+        row_dimensions را در اختیار نمی‌گذارد؛ به همین دلیل از WorkSheetParser
+        همان شیت استفاده می‌شود تا متن و outline level در یک عبور خوانده شوند.
+        اگر API داخلی openpyxl تغییر کرده باشد، load_workbook معمولی استفاده می‌شود.
+        نتیجه تا زمانی که فایل تغییر نکرده cache می‌شود.
 
         Args:
-            row: row dimension از openpyxl
+            file_path: مسیر فایل PMS
+            sheet_name: نام شیت
 
         Returns:
-            سطح outline (0 اگر تعریف نشده)
+            (text_col, outline_level) - دو لیست موازی که اندیس آن‌ها شماره سطر است
+            (اندیس 0 خالی است). متن‌ها strip شده‌اند و سلول خالی None است.
+        """
+        cache_key = (os.path.abspath(file_path), sheet_name)
+        file_hash = PMSCacheManager.get_file_hash(file_path)
+        cached = self._snapshot_cache.get(cache_key)
+        if cached and cached[0] == file_hash:
+            return cached[1], cached[2]
+
+        # مسیر سریع از API داخلی openpyxl استفاده می‌کند (تست شده با openpyxl 3.1.5)؛
+        # اگر نسخه دیگری این API را تغییر داده باشد، خواندن معمولی (کندتر) انجام می‌شود
+        snapshot = None
+        if WorkSheetParser is not None:
+            try:
+                snapshot = self._read_snapshot_parser(file_path, sheet_name)
+            except (AttributeError, TypeError):
+                logger.warning("WorkSheetParser snapshot failed; falling back to load_workbook",
+                               exc_info=True)
+        if snapshot is None:
+            snapshot = self._read_snapshot_workbook(file_path, sheet_name)
+        text_col, row_levels = snapshot
+
+        # ساخت آرایه outline level فقط از سطرهای دارای ویژگی (sparse)
+        outline_level = array('b', bytes(len(text_col)))
+        for row_idx, level in row_levels.items():
+            if level and row_idx < len(text_col):
+                outline_level[row_idx] = level
+
+        self._snapshot_cache[cache_key] = (file_hash, text_col, outline_level)
+        return text_col, outline_level
+
+    def _read_snapshot_parser(self, file_path: str,
+                              sheet_name: str) -> Tuple[List[Optional[str]], Dict[int, int]]:
+        """
+        خواندن ستون متن و outline level سطرها با WorkSheetParser (حالت read-only، یک عبور)
+
+        Args:
+            file_path: مسیر فایل PMS
+            sheet_name: نام شیت
+
+        Returns:
+            (text_col, row_levels) - row_levels: {شماره سطر: outline level}
         """
-        return row.outlineLevel if row.outlineLevel else 0
+        text_col_idx = self.config.PMS.TEXT_COL
+        text_col: List[Optional[str]] = [None]
+
+        wb = openpyxl.load_workbook(file_path, read_only=True, data_only=False)
+        try:
+            ws = wb[sheet_name]
+            with ws._get_source() as src:
+                parser = WorkSheetParser(src,
+                                         ws._shared_strings,
+                                         data_only=wb.data_only,
+                                         epoch=wb.epoch,
+                                         date_formats=wb._date_formats,
+                                         timedelta_formats=wb._timedelta_formats)
+                row_dims = parser.row_dimensions
+
+                for row_idx, cells in parser.parse():
+                    # سطرهای غایب در XML
+                    while len(text_col) < row_idx:
+                        text_col.append(None)
+
+                    value = None
+                    for cell in cells:
+                        if cell['column'] == text_col_idx:
+                            value = cell['value']
+                            break
+
+                    text_col.append(None if value is None else str(value).strip())
+        finally:
+            wb.close()
+
+        row_levels = {int(row_key): int(attrs['outlineLevel'])
+                      for row_key, attrs in row_dims.items() if attrs.get('outlineLevel')}
+        return text_col, row_levels
 
-    def find_items(self, ws: Worksheet, search_path: List[Tuple[int, str]],
-                   target_level: int) -> List[Dict]:
+    def _read_snapshot_workbook(self, file_path: str,
+                                sheet_name: str) -> Tuple[List[Optional[str]], Dict[int, int]]:
         """
-        جستجوی سلسله‌مراتبی برای یافتن آیتم‌های سطح هدف
+        خواندن ستون متن و outline level سطرها فقط با API عمومی openpyxl (مسیر جایگزین)
+
+        row_dimensions فقط در حالت عادی (غیر read-only) در دسترس است.
 
         Args:
-            ws: worksheet
-            search_path: مسیر جستجو [(level, text), ...]
+            file_path: مسیر فایل PMS
+            sheet_name: نام شیت
+
+        Returns:
+            (text_col, row_levels) - row_levels: {شماره سطر: outline level}
+        """
+        text_col_idx = self.config.PMS.TEXT_COL
+
+        wb = openpyxl.load_workbook(file_path, data_only=False)
+        try:
+            ws = wb[sheet_name]
+            text_col: List[Optional[str]] = [None]
+            text_col.extend(
+                None if value is None else str(value).strip()
+                for (value,) in ws.iter_rows(min_col=text_col_idx, max_col=text_col_idx,
+                                             values_only=True)
+            )
+            row_levels = {row_idx: dim.outlineLevel
+                          for row_idx, dim in ws.row_dimensions.items() if dim.outlineLevel}
+        finally:
+            wb.close()
+
+        return text_col, row_levels
+
+    def find_items_multi(self, text_col: List[Optional[str]], outline_level: array,
+                         axis_nums, target_level: int) -> Dict[int, List[ItemRecord]]:
+        """
+        جستجوی سلسله‌مراتبی همه محورها در یک عبور روی سطرها
+
+        برای هر محور وضعیت جداگانه (مرحله فعلی مسیر جستجو) نگه داشته می‌شود؛
+        آیتم‌های سطح هدف زیر مسیر کامل هر محور تا پایان بخش والد جمع می‌شوند.
+
+        Args:
+            text_col: متن ستون A به ازای هر سطر
+            outline_level: outline level به ازای هر سطر
+            axis_nums: شماره محورها
             target_level: سطح هدف برای استخراج آیتم‌ها
 
         Returns:
-            لیست آیتم‌ها [{'row': ..., 'level': ..., 'text': ...}]
+            دیکشنری: {mohor_num: [ItemRecord(row, level, text)]}
         """
-        # مرحله 1: پیدا کردن مسیر کامل
-        parent_row, search_start = self._find_parent_section(ws, search_path)
+        results = {mohor_num: [] for mohor_num in axis_nums}
 
-        if parent_row is None:
-            return []
+        # محورهایی که هنوز مرحله اول مسیر ("محور N") برایشان پیدا نشده،
+        # گروه‌بندی بر اساس سطح و با کلید رشته شماره محور
+        pending = {}
+        for mohor_num in results:
+            search_path = self.config.Hierarchy.get_search_path(mohor_num)
+            pending.setdefault(search_path[0][0], {})[str(mohor_num)] = (mohor_num, search_path)
+
+        # به جای بررسی "محور N" in text برای هر محور، شماره‌ها یک بار با regex
+        # استخراج می‌شوند؛ "محور N" زیررشته متن است اگر N پیشوند یک دنباله رقم
+        # بعد از "محور " باشد
+        level1_re = re.compile(re.escape(self.config.Hierarchy.LEVEL_1_PATTERN) + r' (\d+)')
+
+        # محورهای فعال: {mohor_num: [search_path, current_idx, parent_level]}
+        active = {}
+
+        # lookupهای تکراری داخل حلقه سطرها یک بار bind می‌شوند
+        get_waiting = pending.get
+        find_level1 = level1_re.finditer
+        make_item = ItemRecord
+
+        for row_idx in range(1, len(text_col)):
+            cell_text = text_col[row_idx]
+
+            if cell_text is None:
+                continue
 
-        # مرحله 2: استخراج آیتم‌های سطح هدف
-        return self._extract_target_items(ws, parent_row, search_start, target_level)
+            level = outline_level[row_idx]
+
+            if active:
+                for mohor_num, state in list(active.items()):
+                    search_path, current_idx, parent_level = state
+
+                    if current_idx < len(search_path):
+                        # ادامه پیدا کردن مسیر
+                        step_level, step_text = search_path[current_idx]
+                        if level == step_level and step_text in cell_text:
+                            state[1] = current_idx + 1
+                            state[2] = level
+                    elif level <= parent_level:
+                        # پایان بخش والد
+                        del active[mohor_num]
+                    elif level == target_level:
+                        results[mohor_num].append(make_item(row_idx, level, cell_text))
+
+            waiting = get_waiting(level)
+            if waiting:
+                for match in find_level1(cell_text):
+                    digits = match.group(1)
+                    for end in range(1, len(digits) + 1):
+                        armed = waiting.pop(digits[:end], None)
+                        if armed is not None:
+                            mohor_num, search_path = armed
+                            active[mohor_num] = [search_path, 1, level]
 
-    def _find_parent_section(self, ws: Worksheet,
+        return results
+
+    def _find_parent_section(self, text_col: List[Optional[str]], outline_level: array,
                              search_path: List[Tuple[int, str]]) -> Tuple[Optional[int], Optional[int]]:
         """
         پیدا کردن بخش والد بر اساس مسیر سلسله‌مراتبی
 
         Args:
-            ws: worksheet
+            text_col: متن ستون A به ازای هر سطر
+            outline_level: outline level به ازای هر سطر
             search_path: مسیر جستجو
 
         Returns:
             (شماره سطر والد، شماره سطر شروع جستجو) یا (None, None)
         """
-        current_idx = 0
+        rows_by_level = self._get_level_index(text_col, outline_level)
         parent_row = None
+        start_row = 1
 
-        for row_idx in range(1, ws.max_row + 1):
-            if current_idx >= len(search_path):
-                return parent_row, row_idx
-
-            row = ws.row_dimensions[row_idx]
-            level = self.get_outline_level(row)
-            cell_value = ws.cell(row_idx, self.config.PMS.TEXT_COL).value
-
-            if cell_value is None:
-                continue
+        for step_level, step_text in search_path:
+            # فقط سطرهای هم‌سطح بعد از مرحله قبل بررسی می‌شوند
+            candidates = rows_by_level.get(step_level, [])
 
-            cell_text = str(cell_value).strip()
-            target_level, target_text = search_path[current_idx]
+            for pos in range(bisect_left(candidates, start_row), len(candidates)):
+                row_idx = candidates[pos]
+                if step_text in text_col[row_idx]:
+                    parent_row = row_idx
+                    break
+            else:
+                return None, None
 
-            if level == target_level and target_text in cell_text:
-                parent_row = row_idx
-                current_idx += 1
+            start_row = parent_row + 1
 
-        return (None, None) if current_idx < len(search_path) else (parent_row, parent_row + 1)
+        return (None, None) if parent_row is None else (parent_row, parent_row + 1)
 
-    def _extract_target_items(self, ws: Worksheet, parent_row: int,
-                              start_row: int, target_level: int) -> List[Dict]:
+    def _get_level_index(self, text_col: List[Optional[str]],
+                         outline_level: array) -> Dict[int, List[int]]:
         """
-        استخراج آیتم‌های سطح هدف از زیر بخش والد
+        ساخت (یا بازگرداندن) index سطرهای دارای متن به تفکیک outline level
 
         Args:
-            ws: worksheet
-            parent_row: شماره سطر والد
-            start_row: شماره سطر شروع
-            target_level: سطح هدف
+            text_col: متن ستون A به ازای هر سطر
+            outline_level: outline level به ازای هر سطر
 
         Returns:
-            لیست آیتم‌ها
+            دیکشنری: {level: [row, ...]} (سطرها به ترتیب صعودی)
         """
-        parent_level = self.get_outline_level(ws.row_dimensions[parent_row])
-        found_items = []
-
-        for row_idx in range(start_row, ws.max_row + 1):
-            row = ws.row_dimensions[row_idx]
-            level = self.get_outline_level(row)
-            cell_value = ws.cell(row_idx, self.config.PMS.TEXT_COL).value
-
-            if cell_value is None:
-                continue
-
-            # اگر به سطح مساوی یا کمتر از والد رسیدیم، توقف
-            if level <= parent_level:
-                break
+        cached = self._level_index
+        if cached is not None and cached[0] is outline_level:
+            return cached[1]
 
-            # اگر سطح هدف بود، ذخیره کن
-            if level == target_level:
-                found_items.append({
-                    'row': row_idx,
-                    'level': level,
-                    'text': str(cell_value).strip()
-                })
+        rows_by_level: Dict[int, List[int]] = {}
+        for row_idx in range(1, len(text_col)):
+            if text_col[row_idx] is not None:
+                rows_by_level.setdefault(outline_level[row_idx], []).append(row_idx)
 
-        return found_items
+        self._level_index = (outline_level, rows_by_level)
+        return rows_by_level
 
     def find_last_level5_in_section(self, file_path: str, sheet_name: str,
                                     mohor_num: int) -> Optional[int]:
@@ -735,32 +1009,27 @@ class PMSHierarchySearcher:
         Returns:
             شماره آخرین سطر Level 5 یا None
         """
-        wb = openpyxl.load_workbook(file_path, data_only=False)
-        ws = wb[sheet_name]
+        text_col, outline_level = self.load_sheet_snapshot(file_path, sheet_name)
 
         search_path = self.config.Hierarchy.get_search_path(mohor_num)
-        parent_row, search_start = self._find_parent_section(ws, search_path)
+        parent_row, search_start = self._find_parent_section(text_col, outline_level, search_path)
 
         if parent_row is None:
-            wb.close()
             return None
 
-        # پیدا کردن آخرین Level 5
-        section_level = self.get_outline_level(ws.row_dimensions[parent_row])
-        last_level5 = None
-
-        for row_idx in range(search_start, ws.max_row + 1):
-            row = ws.row_dimensions[row_idx]
-            level = self.get_outline_level(row)
+        # پیدا کردن آخرین Level 5 با جستجوی بایتی روی آرایه سطح‌ها (بدون حلقه پایتون)
+        section_level = outline_level[parent_row]
+        levels = outline_level.tobytes()
 
-            if level <= section_level:
-                break
+        # پایان بخش: اولین سطر (با متن یا بدون متن) با سطح مساوی یا کمتر از بخش
+        end_row = len(levels)
+        for level in range(section_level + 1):
+            pos = levels.find(bytes((level,)), search_start, end_row)
+            if pos != -1:
+                end_row = pos
 
-            if level == self.config.Hierarchy.TARGET_LEVEL:
-                last_level5 = row_idx
-
-        wb.close()
-        return last_level5
+        last_level5 = levels.rfind(bytes((self.config.Hierarchy.TARGET_LEVEL,)), search_start, end_row)
+        return last_level5 if last_level5 != -1 else None
 
 # ================================================================================
 # 📄 ماژول استخراج آیتم‌های PNT
@@ -784,7 +1053,18 @@ class PNTItemExtractor:
         self.normalizer = TextNormalizer()
         self.axis_extractor = AxisExtractor(config)
 
-    def extract_all_items(self, file_path: str, sheet_name: str) -> Tuple[Dict[int, List[Dict]], List[Dict], Any]:
+        # بازه ستون‌های خوانده شده و اندیس هر ستون در تاپل مقادیر سطر (یک بار محاسبه می‌شوند)
+        pnt_cfg = config.PNT
+        used_cols = (pnt_cfg.ITEM_COL, pnt_cfg.QUANTITY_COL,
+                     pnt_cfg.M_VALUE_COL, *pnt_cfg.AXIS_SEARCH_COLS)
+        self._min_col = min(used_cols)
+        self._max_col = max(used_cols)
+        self._item_idx = pnt_cfg.ITEM_COL - self._min_col
+        self._quantity_idx = pnt_cfg.QUANTITY_COL - self._min_col
+        self._m_value_idx = pnt_cfg.M_VALUE_COL - self._min_col
+        self._axis_idx = tuple(col - self._min_col for col in pnt_cfg.AXIS_SEARCH_COLS)
+
+    def extract_all_items(self, file_path: str, sheet_name: str) -> Tuple[Dict[int, List[PNTItem]], List[Dict], Any]:
         """
         استخراج تمام آیتم‌های PNT-G با شناسایی محور
 
@@ -797,72 +1077,76 @@ class PNTItemExtractor:
         """
         self.log_callback(f"\n📂 بارگذاری {file_path}...", "info")
 
-        wb = openpyxl.load_workbook(file_path, data_only=True)
-        ws = wb[sheet_name]
+        pnt_cfg = self.config.PNT
 
-        # خواندن و پاکسازی مقدار G2
-        g2_raw = ws[self.config.PNT.G2_CELL].value
-        g2_value = self.normalizer.clean_g2_value(g2_raw)
+        wb = openpyxl.load_workbook(file_path, read_only=True, data_only=True)
+        try:
+            ws = wb[sheet_name]
 
-        self.log_callback(f"✅ مقدار G2 خام: {g2_raw}", "info")
-        self.log_callback(f"✅ مقدار G2 پاکسازی شده: {g2_value}", "success")
+            # خواندن و پاکسازی مقدار G2
+            g2_raw = ws[pnt_cfg.G2_CELL].value
+            g2_value = self.normalizer.clean_g2_value(g2_raw)
 
-        # استخراج آیتم‌ها
-        items_by_axis = {}
-        unidentified = []
+            self.log_callback(f"✅ مقدار G2 خام: {g2_raw}", "info")
+            self.log_callback(f"✅ مقدار G2 پاکسازی شده: {g2_value}", "success")
 
-        for row in range(self.config.PNT.ROW_START, self.config.PNT.ROW_END):
-            item_data = self._extract_row_data(ws, row)
+            # استخراج آیتم‌ها (یک عبور streaming روی سطرها)
+            items_by_axis = {}
+            unidentified = []
 
-            if item_data is None:
-                continue
+            rows = ws.iter_rows(min_row=pnt_cfg.ROW_START, max_row=pnt_cfg.ROW_END - 1,
+                                min_col=self._min_col, max_col=self._max_col,
+                                values_only=True)
 
-            if item_data['axis'] is None:
-                unidentified.append({
-                    'row': row,
-                    'item': item_data['single_line']
-                })
-                continue
+            for row, values in enumerate(rows, start=pnt_cfg.ROW_START):
+                item_data = self._extract_row_data(row, values)
 
-            # گروه‌بندی بر اساس محور
-            axis_num = item_data['axis']
-            if axis_num not in items_by_axis:
-                items_by_axis[axis_num] = []
+                if item_data is None:
+                    continue
 
-            items_by_axis[axis_num].append(item_data)
+                if item_data.axis is None:
+                    unidentified.append({
+                        'row': row,
+                        'item': item_data.single_line
+                    })
+                    continue
 
-        wb.close()
+                # گروه‌بندی بر اساس محور
+                items_by_axis.setdefault(item_data.axis, []).append(item_data)
+        finally:
+            wb.close()
 
         total_items = sum(len(items) for items in items_by_axis.values())
         self.log_callback(f"✅ {total_items} آیتم استخراج شد از {len(items_by_axis)} محور", "success")
 
         if unidentified:
-            self.log_callback(f"\n⚠️  {len(unidentified)} آیتم بدون محور:", "warning")
-            for item in unidentified[:5]:
-                self.log_callback(f"   ❌ سطر {item['row']}: {item['item']}", "warning")
-            if len(unidentified) > 5:
-                self.log_callback(f"   ... و {len(unidentified) - 5} مورد دیگر", "warning")
+            self.log_callback(_format_preview(
+                f"\n⚠️  {len(unidentified)} آیتم بدون محور:", unidentified,
+                lambda item: f"   ❌ سطر {item['row']}: {item['item']}"
+            ), "warning")
 
         return items_by_axis, unidentified, g2_value
 
-    def _extract_row_data(self, ws: Worksheet, row: int) -> Optional[Dict]:
+    def _extract_row_data(self, row: int, values: Tuple) -> Optional[PNTItem]:
         """
         استخراج داده‌های یک سطر PNT-G
 
         Args:
-            ws: worksheet
             row: شماره سطر
+            values: مقادیر سطر از ستون _min_col تا _max_col (خروجی iter_rows با values_only)
 
         Returns:
-            دیکشنری داده‌های سطر یا None
+            رکورد PNTItem سطر یا None
         """
-        item_value = ws.cell(row, self.config.PNT.ITEM_COL).value
+        item_value = values[self._item_idx]
 
         if not item_value:
             return None
 
         # استخراج محور
-        axis_num = self.axis_extractor.extract_from_row(ws, row)
+        axis_num = self.axis_extractor.extract_from_values(
+            [values[idx] for idx in self._axis_idx]
+        )
 
         # پردازش متن
         original_text = str(item_value).strip()
@@ -873,18 +1157,18 @@ class PNTItemExtractor:
             return None
 
         # خواندن مقادیر
-        quantity = ws.cell(row, self.config.PNT.QUANTITY_COL).value
-        m_value = ws.cell(row, self.config.PNT.M_VALUE_COL).value
-
-        return {
-            'pnt_row': row,
-            'quantity': int(quantity) if quantity else 0,
-            'm_value': m_value,
-            'original': original_text,
-            'single_line': single_line,
-            'normalized': normalized,
-            'axis': axis_num
-        }
+        quantity = values[self._quantity_idx]
+        m_value = values[self._m_value_idx]
+
+        return PNTItem(
+            pnt_row=row,
+            quantity=int(quantity) if quantity else 0,
+            m_value=m_value,
+            original=original_text,
+            single_line=single_line,
+            normalized=normalized,
+            axis=axis_num
+        )
 
 # ================================================================================
 # 🔄 ماژول برنامه‌ریزی به‌روزرسانی
@@ -895,20 +1179,22 @@ class UpdatePlanner:
     کلاس برنامه‌ریزی و تطابق آیتم‌های PNT با PMS
     """
 
-    def __init__(self, config: PMSConfig, log_callback=None):
+    def __init__(self, config: PMSConfig, log_callback=None,
+                 hierarchy_searcher: Optional[PMSHierarchySearcher] = None):
         """
         مقداردهی اولیه
 
         Args:
             config: تنظیمات برنامه
             log_callback: تابع callback برای ارسال لاگ‌ها
+            hierarchy_searcher: جستجوگر مشترک (برای استفاده مجدد از snapshot خوانده شده)
         """
         self.config = config
         self.log_callback = log_callback or print
-        self.hierarchy_searcher = PMSHierarchySearcher(config)
+        self.hierarchy_searcher = hierarchy_searcher or PMSHierarchySearcher(config)
 
     def plan_updates(self, pms_file: str, pms_sheet: str,
-                     item_locations: Dict, items_by_axis: Dict[int, List[Dict]],
+                     item_locations: Dict, items_by_axis: Dict[int, List[PNTItem]],
                      g2_value: Any) -> Tuple[List[Dict], List[Dict], List[Dict]]:
         """
         برنامه‌ریزی به‌روزرسانی‌ها با تطابق آیتم‌ها
@@ -930,6 +1216,8 @@ class UpdatePlanner:
         warnings = []
         found_existing = 0
         found_new = 0
+        # آخرین Level 5 هر محور فقط یک بار محاسبه می‌شود
+        last_level5_by_axis: Dict[int, Optional[int]] = {}
 
         for mohor_num, items in items_by_axis.items():
             mohor_name = f"محور {mohor_num}"
@@ -937,7 +1225,7 @@ class UpdatePlanner:
             for pnt_data in items:
                 result = self._match_item(
                     pms_file, pms_sheet, mohor_name, mohor_num,
-                    pnt_data, item_locations, g2_value
+                    pnt_data, item_locations, g2_value, last_level5_by_axis
                 )
 
                 if result['status'] == 'existing':
@@ -954,29 +1242,26 @@ class UpdatePlanner:
                     not_found.append(result['error'])
 
         # گزارش تطابق
-        self.log_callback(f"\n✅ آیتم‌های موجود: {found_existing}", "success")
-        self.log_callback(f"🆕 آیتم‌های جدید: {found_new}", "success")
+        self.log_callback(f"\n✅ آیتم‌های موجود: {found_existing}\n🆕 آیتم‌های جدید: {found_new}", "success")
         self.log_callback(f"❌ آیتم‌های قابل درج نیستند: {len(not_found)}", "error" if not_found else "info")
 
         if warnings:
-            self.log_callback(f"\n⚠️  {len(warnings)} آیتم نیاز به درج سطر دارند:", "warning")
-            for w in warnings[:5]:
-                self.log_callback(f"   - {w['item']} ({w['mohor']}): کمبود {w['deficit']} سطر", "warning")
-            if len(warnings) > 5:
-                self.log_callback(f"   ... و {len(warnings) - 5} مورد دیگر", "warning")
+            self.log_callback(_format_preview(
+                f"\n⚠️  {len(warnings)} آیتم نیاز به درج سطر دارند:", warnings,
+                lambda w: f"   - {w['item']} ({w['mohor']}): کمبود {w['deficit']} سطر"
+            ), "warning")
 
         if not_found:
-            self.log_callback(f"\n❌ آیتم‌های قابل درج نیستند:", "error")
-            for item in not_found[:5]:
-                self.log_callback(f"   - {item['item']} ({item['mohor']}): {item['reason']}", "error")
-            if len(not_found) > 5:
-                self.log_callback(f"   ... و {len(not_found) - 5} مورد دیگر", "error")
+            self.log_callback(_format_preview(
+                "\n❌ آیتم‌های قابل درج نیستند:", not_found,
+                lambda item: f"   - {item['item']} ({item['mohor']}): {item['reason']}"
+            ), "error")
 
         return updates, not_found, warnings
 
     def _match_item(self, pms_file: str, pms_sheet: str, mohor_name: str,
-                    mohor_num: int, pnt_data: Dict, item_locations: Dict,
-                    g2_value: Any) -> Dict:
+                    mohor_num: int, pnt_data: PNTItem, item_locations: Dict,
+                    g2_value: Any, last_level5_by_axis: Dict[int, Optional[int]]) -> Dict:
         """
         تطابق یک آیتم PNT با PMS
 
@@ -988,57 +1273,59 @@ class UpdatePlanner:
             pnt_data: داده‌های آیتم از PNT
             item_locations: دیکشنری موقعیت‌ها
             g2_value: مقدار G2
+            last_level5_by_axis: cache آخرین Level 5 هر محور (در همین متد پر می‌شود)
 
         Returns:
             دیکشنری نتیجه تطابق
         """
-        normalized_item = pnt_data['normalized']
+        normalized_item = pnt_data.normalized
 
-        # بررسی وجود در PMS
-        if normalized_item in item_locations:
-            mohor_locations = [
-                loc for loc in item_locations[normalized_item]
-                if loc['mohor'] == mohor_name
-            ]
+        # بررسی وجود در PMS (آیتم و محور)
+        mohor_locations = item_locations.get(normalized_item, {}).get(mohor_name)
 
-            if mohor_locations:
-                # آیتم موجود است
-                return self._create_existing_update(
-                    mohor_name, pnt_data, mohor_locations, g2_value
-                )
+        if mohor_locations:
+            # آیتم موجود است
+            return self._create_existing_update(
+                mohor_name, pnt_data, mohor_locations, g2_value
+            )
 
         # آیتم جدید - باید درج شود
+        if mohor_num not in last_level5_by_axis:
+            last_level5_by_axis[mohor_num] = self.hierarchy_searcher.find_last_level5_in_section(
+                pms_file, pms_sheet, mohor_num
+            )
+
         return self._create_new_update(
-            pms_file, pms_sheet, mohor_name, mohor_num, pnt_data, g2_value
+            mohor_name, pnt_data, g2_value, last_level5_by_axis[mohor_num]
         )
 
-    def _create_existing_update(self, mohor_name: str, pnt_data: Dict,
-                                locations: List[Dict], g2_value: Any) -> Dict:
+    def _create_existing_update(self, mohor_name: str, pnt_data: PNTItem,
+                                locations: List[int], g2_value: Any) -> Dict:
         """
         ایجاد به‌روزرسانی برای آیتم موجود
 
         Args:
             mohor_name: نام محور
             pnt_data: داده‌های PNT
-            locations: لیست موقعیت‌های آیتم در PMS
+            locations: لیست شماره سطرهای آیتم در PMS
             g2_value: مقدار G2
 
         Returns:
             دیکشنری نتیجه
         """
-        needed_quantity = pnt_data['quantity']
+        needed_quantity = pnt_data.quantity
         current_quantity = len(locations)
 
         result = {
             'status': 'existing',
             'update': {
                 'mohor': mohor_name,
-                'item_text': pnt_data['single_line'],
-                'existing_rows': [loc['row'] for loc in locations],
+                'item_text': pnt_data.single_line,
+                'existing_rows': list(locations),
                 'needed_quantity': needed_quantity,
-                'a_value': pnt_data['single_line'],
+                'a_value': pnt_data.single_line,
                 'e_value': g2_value,
-                'n_value': pnt_data['m_value'],
+                'n_value': pnt_data.m_value,
                 'is_new_item': False
             }
         }
@@ -1047,7 +1334,7 @@ class UpdatePlanner:
         if current_quantity < needed_quantity:
             deficit = needed_quantity - current_quantity
             result['warning'] = {
-                'item': pnt_data['single_line'],
+                'item': pnt_data.single_line,
                 'mohor': mohor_name,
                 'needed': needed_quantity,
                 'available': current_quantity,
@@ -1056,39 +1343,32 @@ class UpdatePlanner:
 
         return result
 
-    def _create_new_update(self, pms_file: str, pms_sheet: str,
-                           mohor_name: str, mohor_num: int,
-                           pnt_data: Dict, g2_value: Any) -> Dict:
+    def _create_new_update(self, mohor_name: str, pnt_data: PNTItem,
+                           g2_value: Any, last_level5: Optional[int]) -> Dict:
         """
         ایجاد به‌روزرسانی برای آیتم جدید
 
         Args:
-            pms_file: مسیر فایل PMS
-            pms_sheet: نام شیت
             mohor_name: نام محور
-            mohor_num: شماره محور
             pnt_data: داده‌های PNT
             g2_value: مقدار G2
+            last_level5: شماره آخرین سطر Level 5 محور (یا None)
 
         Returns:
             دیکشنری نتیجه
         """
-        last_level5 = self.hierarchy_searcher.find_last_level5_in_section(
-            pms_file, pms_sheet, mohor_num
-        )
-
         if last_level5:
             return {
                 'status': 'new',
                 'update': {
                     'mohor': mohor_name,
-                    'item_text': f"🆕 {pnt_data['single_line']}",
+                    'item_text': f"🆕 {pnt_data.single_line}",
                     'existing_rows': [last_level5],
-                    'needed_quantity': pnt_data['quantity'],
-                    'a_value': pnt_data['single_line'],
+                    'needed_quantity': pnt_data.quantity,
+                    'a_value': pnt_data.single_line,
                     'e_value': g2_value,
-                    'n_value': pnt_data['m_value'],
-                    'g_value': pnt_data['m_value'],
+                    'n_value': pnt_data.m_value,
+                    'g_value': pnt_data.m_value,
                     'is_new_item': True
                 }
             }
@@ -1096,7 +1376,7 @@ class UpdatePlanner:
             return {
                 'status': 'not_found',
                 'error': {
-                    'item': pnt_data['single_line'],
+                    'item': pnt_data.single_line,
                     'mohor': mohor_name,
                     'reason': 'محور یا Level 5 در PMS یافت نشد'
                 }
@@ -1106,6 +1386,41 @@ class UpdatePlanner:
 # 🔄 ماژول به‌روزرسانی با COM
 # ================================================================================
 
+# خط جداکننده بنرهای لاگ
+_SEP = "=" * 50
+
+
+class BufferedLog:
+    """
+    جمع‌آوری لاگ‌ها و ارسال پیام‌های پشت‌سرهم هم‌نوع در یک فراخوانی
+
+    هر فراخوانی log_callback در UI یک signal بین thread و یک append در کنسول است؛
+    پیام‌های هم‌نوع یک آیتم با '\\n' به هم متصل و یکجا ارسال می‌شوند.
+    """
+
+    def __init__(self, log_callback):
+        """
+        Args:
+            log_callback: تابع callback اصلی (msg, type)
+        """
+        self.log_callback = log_callback
+        self._lines: List[str] = []
+        self._msg_type: Optional[str] = None
+
+    def __call__(self, msg: str, msg_type: str = 'info'):
+        if msg_type != self._msg_type:
+            self.flush()
+            self._msg_type = msg_type
+        self._lines.append(msg)
+
+    def flush(self):
+        """ارسال پیام‌های جمع‌شده"""
+        if self._lines:
+            self.log_callback('\n'.join(self._lines), self._msg_type)
+            self._lines = []
+        self._msg_type = None
+
+
 class COMUpdater:
     """
     کلاس به‌روزرسانی فایل Excel با استفاده از win32com
@@ -1131,28 +1446,26 @@ class COMUpdater:
             sheet_name: نام شیت
             updates: لیست به‌روزرسانی‌ها
         """
-        self.log_callback("\n" + "=" * 50, "info")
-        self.log_callback("🔧 باز کردن Excel با COM...", "info")
-        self.log_callback("=" * 50, "info")
-
-        abs_path = os.path.abspath(file_path)
-        self.log_callback(f"📂 مسیر فایل: {abs_path}", "info")
-
-        if not os.path.exists(abs_path):
-            raise FileNotFoundError(f"❌ فایل یافت نشد: {abs_path}")
+        self.log_callback(f"\n{_SEP}\n🔧 باز کردن Excel با COM...\n{_SEP}", "info")
 
-        # باز کردن فایل با openpyxl برای بررسی ستون E
-        self.log_callback("🔍 بررسی وضعیت ستون E...", "info")
-        wb_check = openpyxl.load_workbook(abs_path, data_only=True)
-        ws_check = wb_check[sheet_name]
+        abs_path = self._resolve_path(file_path)
 
         xl = None
         wb = None
 
+        # update_file از thread کارگر UI هم صدا زده می‌شود؛ هر thread باید COM را خودش مقداردهی کند
+        pythoncom.CoInitialize()
+
         try:
-            xl = win32com.client.Dispatch("Excel.Application")
+            # early binding (makepy) برای dispatch مستقیم بدون GetIDsOfNames در هر فراخوانی
+            try:
+                xl = win32com.client.gencache.EnsureDispatch("Excel.Application")
+            except Exception:
+                xl = win32com.client.Dispatch("Excel.Application")
             xl.Visible = False
             xl.DisplayAlerts = False
+            xl.ScreenUpdating = False
+            xl.EnableEvents = False
 
             self.log_callback(f"🔓 در حال باز کردن Workbook...", "info")
             wb = xl.Workbooks.Open(abs_path)
@@ -1160,14 +1473,25 @@ class COMUpdater:
             if wb is None:
                 raise RuntimeError("❌ Workbook باز نشد")
 
+            # محاسبه دستی تا هر درج/کپی ردیف باعث محاسبه مجدد کل شیت نشود
+            # (Calculation فقط بعد از باز شدن یک Workbook قابل تنظیم است)
+            xl.Calculation = -4135  # xlCalculationManual
+
             ws = wb.Worksheets(sheet_name)
             self.log_callback(f"✅ شیت '{sheet_name}' یافت شد", "success")
 
+            # ستون E از همان Workbook باز شده در Excel خوانده می‌شود (بدون parse دوباره فایل)
+            self.log_callback("🔍 بررسی وضعیت ستون E...", "info")
+            e_values = self._read_column_values_com(ws, self.config.PMS.DATE_COL)
+
             # پردازش به‌روزرسانی‌ها
-            stats = self._process_updates(ws, ws_check, updates)
+            stats = self._process_updates(ws, e_values, updates)
 
-            # ذخیره
+            # یک بار محاسبه کامل و بازگرداندن حالت محاسبه خودکار قبل از ذخیره
+            # (حالت Calculation همراه فایل ذخیره می‌شود؛ فایل نباید با حالت دستی ذخیره شود)
             self.log_callback(f"\n💾 ذخیره‌سازی...", "info")
+            xl.Calculate()
+            xl.Calculation = -4105  # xlCalculationAutomatic
             wb.Save()
 
             # گزارش نهایی
@@ -1175,27 +1499,78 @@ class COMUpdater:
 
         except Exception as e:
             self.log_callback(f"\n❌ خطا: {e}", "error")
-            import traceback
-            traceback.print_exc()
+            logger.exception("update_file failed")
             raise
 
         finally:
             try:
-                wb_check.close()
+                if xl:
+                    # بازگرداندن تنظیمات Excel (نمونه Excel ممکن است مشترک باشد)
+                    if wb:
+                        xl.Calculation = -4105  # xlCalculationAutomatic
+                    xl.ScreenUpdating = True
+                    xl.EnableEvents = True
                 if wb:
                     wb.Close(SaveChanges=False)
                 if xl:
                     xl.Quit()
             except:
                 pass
+            xl = wb = ws = None
+            pythoncom.CoUninitialize()
+
+    def _resolve_path(self, file_path: str) -> str:
+        """
+        تبدیل به مسیر مطلق و بررسی وجود فایل با یک stat
+
+        Args:
+            file_path: مسیر فایل
 
-    def _process_updates(self, ws_com, ws_check, updates: List[Dict]) -> Dict:
+        Returns:
+            مسیر مطلق فایل
+        """
+        abs_path = os.path.abspath(file_path)
+        self.log_callback(f"📂 مسیر فایل: {abs_path}", "info")
+
+        if not os.path.isfile(abs_path):
+            raise FileNotFoundError(f"❌ فایل یافت نشد: {abs_path}")
+
+        return abs_path
+
+    @staticmethod
+    def _read_column_values_com(ws, col: int) -> Dict[int, Any]:
+        """
+        خواندن مقادیر غیرخالی یک ستون از worksheet COM با یک فراخوانی Value2
+
+        Args:
+            ws: worksheet COM
+            col: شماره ستون
+
+        Returns:
+            دیکشنری {شماره ردیف: مقدار}
+        """
+        used = ws.UsedRange
+        last_row = used.Row + used.Rows.Count - 1
+
+        # Value2 بدون تبدیل تاریخ/ارز (فقط خالی بودن سلول بررسی می‌شود)
+        values = ws.Range(ws.Cells(1, col), ws.Cells(last_row, col)).Value2
+        # محدوده تک‌سلولی مقدار اسکالر برمی‌گرداند
+        if not isinstance(values, tuple):
+            values = ((values,),)
+
+        return {
+            row_idx: row[0]
+            for row_idx, row in enumerate(values, start=1)
+            if row[0] is not None
+        }
+
+    def _process_updates(self, ws_com, e_values: Dict[int, Any], updates: List[Dict]) -> Dict:
         """
         پردازش لیست به‌روزرسانی‌ها
 
         Args:
             ws_com: worksheet COM
-            ws_check: worksheet openpyxl (برای چک کردن ستون E)
+            e_values: مقادیر ستون E به تفکیک ردیف (برای چک کردن ردیف‌های پُر)
             updates: لیست به‌روزرسانی‌ها
 
         Returns:
@@ -1207,69 +1582,91 @@ class COMUpdater:
             'skipped': 0
         }
 
-        for update in updates:
+        # لاگ‌های هر آیتم بافر و در پایان همان آیتم یکجا ارسال می‌شوند
+        log_callback = self.log_callback
+        buffered_log = BufferedLog(log_callback)
+        self.log_callback = buffered_log
+
+        # آیتم‌های جدید پشت‌سرهم با ردیف الگوی یکسان یک گروه می‌شوند (یک درج برای کل گروه)
+        def group_key(update):
             if update.get('is_new_item'):
-                stats['inserted'] += self._process_new_item(ws_com, update)
-            else:
-                result = self._process_existing_item(ws_com, ws_check, update)
-                stats['inserted'] += result['inserted']
-                stats['updated'] += result['updated']
-                stats['skipped'] += result['skipped']
+                return 'new', update['existing_rows'][-1]
+            return 'existing', id(update)
+
+        try:
+            for (kind, _), group in groupby(updates, key=group_key):
+                if kind == 'new':
+                    stats['inserted'] += self._process_new_items(ws_com, list(group))
+                else:
+                    update = next(group)
+                    result = self._process_existing_item(ws_com, e_values, update)
+                    stats['inserted'] += result['inserted']
+                    stats['updated'] += result['updated']
+                    stats['skipped'] += result['skipped']
+
+                buffered_log.flush()
+        finally:
+            buffered_log.flush()
+            self.log_callback = log_callback
 
         return stats
 
-    def _process_new_item(self, ws, update: Dict) -> int:
+    def _process_new_items(self, ws, group: List[Dict]) -> int:
         """
-        پردازش آیتم جدید (درج + کپی کامل از ردیف الگو + آپدیت A, E, G, N)
+        پردازش گروهی از آیتم‌های جدید با ردیف الگوی یکسان
+        (یک درج + کپی کامل از ردیف الگو برای کل گروه + آپدیت A, E, G, N هر آیتم)
+
+        ترتیب نهایی ردیف‌ها مانند درج تک‌به‌تک است: آیتم بعدی بالای آیتم قبلی
+        (درست زیر ردیف الگو) قرار می‌گیرد.
 
         Args:
             ws: worksheet COM
-            update: دیکشنری به‌روزرسانی
+            group: دیکشنری‌های به‌روزرسانی (همه با existing_rows[-1] یکسان)
 
         Returns:
             تعداد ردیف‌های درج شده
         """
-        item_text = update['item_text']
-        existing_rows = update['existing_rows']
-        needed_quantity = update['needed_quantity']
-        a_value = update['a_value']
-        e_value = update['e_value']
-        g_value = update['g_value']
-        n_value = update['n_value']
-
-        self.log_callback(f"\n📝 {item_text}", "info")
-        self.log_callback(f"   🆕 آیتم جدید - درج {needed_quantity} ردیف", "info")
+        pms_cfg = self.config.PMS
 
         # ردیف الگو = آخرین ردیف Level 5 پیدا شده
-        template_row = existing_rows[-1]
-        inserted_count = 0
+        template_row = group[0]['existing_rows'][-1]
+        total_quantity = sum(update['needed_quantity'] for update in group)
 
-        for i in range(needed_quantity):
-            new_row = template_row + i + 1
-            ws.Rows(new_row).Insert()
+        for update in group:
+            self.log_callback(f"\n📝 {update['item_text']}", "info")
+            self.log_callback(f"   🆕 آیتم جدید - درج {update['needed_quantity']} ردیف", "info")
 
-            # ✅ مرحله 1: کپی کامل ردیف (شامل تمام مقادیر و فرمول‌ها)
-            self._copy_row_with_values(ws, template_row, new_row)
+        # ✅ مرحله 1: درج یکجای ردیف‌های کل گروه و کپی کامل ردیف الگو (شامل تمام مقادیر و فرمول‌ها)
+        self._insert_rows_copy(ws, template_row, template_row + 1, total_quantity)
 
-            # ✅ مرحله 2: بازنویسی فقط ستون‌های A, E, G, N
-            ws.Cells(new_row, self.config.PMS.TEXT_COL).Value = a_value
-            ws.Cells(new_row, self.config.PMS.DATE_COL).Value = e_value
-            ws.Cells(new_row, self.config.PMS.G_COL).Value = g_value
-            ws.Cells(new_row, self.config.PMS.N_COL).Value = n_value
+        # ✅ مرحله 2: بازنویسی فقط ستون‌های A, E, G, N در بلوک هر آیتم
+        next_row = template_row + 1
+        for update in reversed(group):
+            needed_quantity = update['needed_quantity']
+            new_rows = list(range(next_row, next_row + needed_quantity))
+            next_row += needed_quantity
 
-            existing_rows.append(new_row)
-            inserted_count += 1
+            self._write_rows(ws, new_rows, {
+                pms_cfg.TEXT_COL: update['a_value'],
+                pms_cfg.DATE_COL: update['e_value'],
+                pms_cfg.G_COL: update['g_value'],
+                pms_cfg.N_COL: update['n_value']
+            })
 
-        self.log_callback(f"   ✅ {needed_quantity} ردیف درج شد", "success")
-        return inserted_count
+            update['existing_rows'].extend(new_rows)
 
-    def _process_existing_item(self, ws_com, ws_check, update: Dict) -> Dict:
+        for update in group:
+            self.log_callback(f"   ✅ {update['needed_quantity']} ردیف درج شد", "success")
+
+        return total_quantity
+
+    def _process_existing_item(self, ws_com, e_values: Dict[int, Any], update: Dict) -> Dict:
         """
         پردازش آیتم موجود (فیلترینگ E + درج در صورت کمبود + آپدیت A, E, N)
 
         Args:
             ws_com: worksheet COM
-            ws_check: worksheet openpyxl
+            e_values: مقادیر ستون E به تفکیک ردیف
             update: دیکشنری به‌روزرسانی
 
         Returns:
@@ -1281,19 +1678,23 @@ class COMUpdater:
         a_value = update['a_value']
         e_value = update['e_value']
         n_value = update['n_value']
+        pms_cfg = self.config.PMS
 
         self.log_callback(f"\n📝 {item_text}", "info")
 
-        # فیلتر ردیف‌های خالی و پُر
+        # فیلتر ردیف‌های خالی و پُر (یک عبور با متدهای bind شده محلی)
         filled_rows = []
         empty_rows = []
+        add_filled = filled_rows.append
+        add_empty = empty_rows.append
+        get_e = e_values.get
 
         for row in existing_rows:
-            e_cell_value = ws_check.cell(row, self.config.PMS.DATE_COL).value
-            if e_cell_value is None or str(e_cell_value).strip() == "":
-                empty_rows.append(row)
+            e_cell_value = get_e(row)
+            if e_cell_value is not None and str(e_cell_value).strip():
+                add_filled(row)
             else:
-                filled_rows.append(row)
+                add_empty(row)
 
         stats = {'inserted': 0, 'updated': 0, 'skipped': len(filled_rows)}
 
@@ -1309,55 +1710,116 @@ class COMUpdater:
             self.log_callback(f"   ➕ درج {deficit} ردیف جدید...", "info")
             last_row = existing_rows[-1]
 
-            for i in range(deficit):
-                new_row = last_row + i + 1
-                ws_com.Rows(new_row).Insert()
-
-                # ✅ کپی کامل ردیف (با مقادیر)
-                self._copy_row_with_values(ws_com, last_row, new_row)
-
-                # آپدیت فقط A, E, N (G دست نخورده)
-                ws_com.Cells(new_row, self.config.PMS.TEXT_COL).Value = a_value
-                ws_com.Cells(new_row, self.config.PMS.DATE_COL).Value = e_value
-                ws_com.Cells(new_row, self.config.PMS.N_COL).Value = n_value
+            # ✅ درج یکجا و کپی کامل ردیف (با مقادیر)
+            self._insert_rows_copy(ws_com, last_row, last_row + 1, deficit)
+            new_rows = list(range(last_row + 1, last_row + 1 + deficit))
 
-                empty_rows.append(new_row)
-                existing_rows.append(new_row)
-                stats['inserted'] += 1
+            # ردیف‌های جدید جزو ردیف‌های خالی هستند و همراه آن‌ها آپدیت می‌شوند
+            empty_rows.extend(new_rows)
+            existing_rows.extend(new_rows)
+            stats['inserted'] += deficit
 
-        # آپدیت ردیف‌های خالی
+        # آپدیت ردیف‌های خالی - فقط A, E, N (G دست نخورده)
         rows_to_update = empty_rows[:needed_quantity]
 
-        for row in rows_to_update:
-            ws_com.Cells(row, self.config.PMS.TEXT_COL).Value = a_value
-            ws_com.Cells(row, self.config.PMS.DATE_COL).Value = e_value
-            ws_com.Cells(row, self.config.PMS.N_COL).Value = n_value
-            stats['updated'] += 1
+        # آیتم بدون ردیف قابل آپدیت (مثلاً مقدار 0 در PNT) - بدون فراخوانی COM
+        if not rows_to_update:
+            self.log_callback("   ⏭️  ردیفی برای آپدیت وجود ندارد", "info")
+            return stats
+
+        self._write_rows(ws_com, rows_to_update, {
+            pms_cfg.TEXT_COL: a_value,
+            pms_cfg.DATE_COL: e_value,
+            pms_cfg.N_COL: n_value
+        })
+        stats['updated'] += len(rows_to_update)
 
         self.log_callback(f"   ✅ {len(rows_to_update)} ردیف آپدیت شد", "success")
         self.log_callback(f"   📍 ردیف‌ها: {', '.join(map(str, rows_to_update))}", "info")
 
         return stats
 
-    def _copy_row_with_values(self, ws, source_row: int, target_row: int):
+    @staticmethod
+    def _contiguous_runs(rows: List[int]) -> List[Tuple[int, int]]:
+        """
+        تقسیم شماره ردیف‌ها به بازه‌های پیوسته
+
+        Args:
+            rows: شماره ردیف‌ها
+
+        Returns:
+            لیست (ردیف اول، ردیف آخر) هر بازه
+        """
+        runs = []
+        for row in sorted(rows):
+            if runs and row == runs[-1][1] + 1:
+                runs[-1][1] = row
+            else:
+                runs.append([row, row])
+        return [(first, last) for first, last in runs]
+
+    def _write_rows(self, ws, rows: List[int], values: Dict[int, Any]):
+        """
+        نوشتن مقدار ثابت هر ستون در همه ردیف‌های داده شده
+
+        برای هر بازه پیوسته از ردیف‌ها و هر ستون یک انتساب Range.Value
+        انجام می‌شود (به جای یک فراخوانی COM به ازای هر سلول).
+
+        Args:
+            ws: worksheet COM
+            rows: شماره ردیف‌ها
+            values: دیکشنری {ستون: مقدار}
+        """
+        ws_range = ws.Range
+        ws_cells = ws.Cells
+
+        for first, last in self._contiguous_runs(rows):
+            count = last - first + 1
+            for col, value in values.items():
+                ws_range(ws_cells(first, col), ws_cells(last, col)).Value = ((value,),) * count
+
+    def _insert_rows_copy(self, ws, source_row: int, first_row: int, count: int):
+        """
+        درج count ردیف از first_row و کپی ردیف الگو در هر کدام
+
+        Args:
+            ws: worksheet COM
+            source_row: شماره ردیف الگو (بالای first_row)
+            first_row: شماره اولین ردیف جدید
+            count: تعداد ردیف‌ها
+        """
+        if count <= 0:
+            return
+
+        # یک درج برای کل بلوک (به جای یک Insert و شیفت شیت به ازای هر ردیف)
+        ws.Range(ws.Rows(first_row), ws.Rows(first_row + count - 1)).Insert(Shift=-4121)  # xlShiftDown
+        self._copy_row_with_values(ws, source_row, first_row, count)
+
+    def _copy_row_with_values(self, ws, source_row: int, target_row: int, count: int = 1):
         """
         کپی کامل یک ردیف (محتوا + فرمول + استایل + outline)
 
+        کپی با Range.Copy(Destination=...) در یک فراخوانی و بدون clipboard انجام
+        می‌شود؛ ردیف الگو در تمام ردیف‌های مقصد تکرار و ارجاع‌های نسبی فرمول‌ها
+        مانند paste معمولی برای هر ردیف تنظیم می‌شوند.
+
         Args:
             ws: worksheet COM
             source_row: شماره ردیف مبدا (الگو)
-            target_row: شماره ردیف مقصد (جدید)
+            target_row: شماره اولین ردیف مقصد (جدید)
+            count: تعداد ردیف‌های مقصد (ردیف الگو در همه تکرار می‌شود)
         """
         try:
             source_range = ws.Rows(source_row)
-            target_range = ws.Rows(target_row)
+            target_range = ws.Range(ws.Rows(target_row), ws.Rows(target_row + count - 1))
 
-            # کپی کامل (All = محتوا + فرمت + فرمول)
-            source_range.Copy()
-            target_range.PasteSpecial(Paste=-4104)  # xlPasteAll
+            # محتوا، فرمول‌ها و قالب‌بندی
+            source_range.Copy(Destination=target_range)
 
-            # تنظیم outline level
-            target_range.OutlineLevel = source_range.OutlineLevel
+            # تنظیم outline level (در صورت تفاوت)
+            source_level = source_range.OutlineLevel
+            if target_range.OutlineLevel != source_level:
+                target_range.OutlineLevel = source_level
 
         except Exception as e:
             self.log_callback(f"⚠️  خطا در کپی ردیف {source_row}: {e}", "warning")
@@ -1370,18 +1832,14 @@ class COMUpdater:
         Args:
             stats: دیکشنری آمار
         """
-        self.log_callback(f"\n" + "=" * 50, "info")
+        self.log_callback("\n" + _SEP, "info")
         self.log_callback(f"✅ خلاصه:", "success")
         self.log_callback(f"   🆕 ردیف‌های درج شده: {stats['inserted']}", "success")
         self.log_callback(f"   🔄 ردیف‌های آپدیت شده: {stats['updated']}", "success")
         self.log_callback(f"   ⏭️  ردیف‌های نادیده گرفته شده (E پُر): {stats['skipped']}", "info")
-        self.log_callback("=" * 50, "info")
+        self.log_callback(_SEP, "info")
 
 
-# ================================================================================
-# 🚀 هماهنگ‌کننده اصلی
-# ================================================================================
-
 # ================================================================================
 # 🚀 هماهنگ‌کننده اصلی
 # ================================================================================
@@ -1404,8 +1862,20 @@ class PMSUpdateOrchestrator:
         self.cache_manager = PMSCacheManager(config.CACHE_FILE, self.log_callback)
         self.structure_reader = PMSStructureReader(config, self.log_callback)
         self.pnt_extractor = PNTItemExtractor(config, self.log_callback)
-        self.update_planner = UpdatePlanner(config, self.log_callback)
-        self.com_updater = COMUpdater(config, self.log_callback)
+        # جستجوگر مشترک: snapshot شیت PMS فقط یک بار خوانده و hash می‌شود
+        self.update_planner = UpdatePlanner(config, self.log_callback,
+                                            self.structure_reader.hierarchy_searcher)
+        # نویسنده فایل فقط در مرحله اجرا ساخته می‌شود (Dry Run بدون Excel هم کار می‌کند)
+        self._com_updater = None
+
+    @property
+    def com_updater(self) -> 'COMUpdater':
+        """نویسنده فایل PMS با COM (ساخت در اولین استفاده؛ نیازمند Excel و win32com)"""
+        if self._com_updater is None:
+            if win32com is None:
+                raise RuntimeError("❌ نوشتن فایل PMS نیازمند Excel و win32com است (pip install pywin32)")
+            self._com_updater = COMUpdater(self.config, self.log_callback)
+        return self._com_updater
 
     @staticmethod
     def _default_log(msg: str, msg_type: str = 'info'):
@@ -1419,9 +1889,7 @@ class PMSUpdateOrchestrator:
         Returns:
             دیکشنری نتایج
         """
-        self.log_callback("=" * 50, "info")
-        self.log_callback("🚀 شروع فرآیند کامل به‌روزرسانی PMS از PNT-G", "info")
-        self.log_callback("=" * 50, "info")
+        self.log_callback(f"{_SEP}\n🚀 شروع فرآیند کامل به‌روزرسانی PMS از PNT-G\n{_SEP}", "info")
 
         # مرحله 1: بارگذاری ساختار PMS (با Cache)
         self.log_callback("\n📥 بارگذاری ساختار PMS...", "info")
@@ -1444,6 +1912,12 @@ class PMSUpdateOrchestrator:
             g2_value
         )
 
+        # snapshot شیت PMS (ستون متن + outline level)، index سطرها، ساختار PMS و
+        # آیتم‌های PNT بعد از برنامه‌ریزی لازم نیستند؛ قبل از مرحله نوشتن آزاد
+        # می‌شوند تا اوج مصرف حافظه پایین بیاید (snapshot بعد از نوشتن کهنه هم می‌شود)
+        self.structure_reader.hierarchy_searcher.release()
+        del item_locations, items_by_axis
+
         # مرحله 4: اجرای به‌روزرسانی
         if updates:
             self.com_updater.update_file(
@@ -1514,9 +1988,9 @@ class PMSUpdateOrchestrator:
             warnings: لیست هشدارها
             unidentified: لیست آیتم‌های بدون محور
         """
-        self.log_callback("\n" + "=" * 50, "info")
+        self.log_callback("\n" + _SEP, "info")
         self.log_callback("🏁 پایان عملیات", "success")
-        self.log_callback("=" * 50, "info")
+        self.log_callback(_SEP, "info")
         self.log_callback(f"📊 خلاصه گزارش:", "info")
 
         existing_count = sum(1 for u in updates if not u.get('is_new_item'))
@@ -1530,7 +2004,7 @@ class PMSUpdateOrchestrator:
         if unidentified:
             self.log_callback(f"   🔍 آیتم‌های بدون محور: {len(unidentified)}", "warning")
 
-        self.log_callback("=" * 50, "info")
+        self.log_callback(_SEP, "info")
 
 # ================================================================================
 # 🎯 نقطه ورود برنامه
@@ -1540,6 +2014,10 @@ def main():
     """
     تابع اصلی برنامه
     """
+    # traceback خطاها (logger.exception) در stderr نمایش داده می‌شود
+    logging.basicConfig(level=logging.WARNING,
+                        format="%(asctime)s %(levelname)s %(name)s: %(message)s")
+
     try:
         # ایجاد orchestrator با تنظیمات پیش‌فرض
         orchestrator = PMSUpdateOrchestrator(PMSConfig())
@@ -1556,8 +2034,7 @@ def main():
         return None
     except Exception as e:
         print(f"\n❌ خطای کلی: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("main failed")
         return None
 
 if __name__ == "__main__":
@@ -16,27 +16,67 @@
 
 import sys
 import os
-from pathlib import Path
+import logging
+from stat import S_ISREG
 from typing import Optional, List, Dict, Any
 from datetime import datetime
 
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
     QTabWidget, QPushButton, QLabel, QLineEdit, QComboBox, QCheckBox,
-    QProgressBar, QTextEdit, QTableWidget, QTableWidgetItem, QFileDialog,
-    QGroupBox, QGridLayout, QHeaderView, QMessageBox, QFrame, QSplitter,
-    QAbstractItemView
+    QProgressBar, QPlainTextEdit, QTableView, QFileDialog,
+    QGroupBox, QGridLayout, QMessageBox, QFrame,
+    QAbstractItemView, QSplashScreen
 )
 from PyQt6.QtCore import (
-    Qt, QThread, pyqtSignal, QTimer, QSettings
+    Qt, QThread, pyqtSignal, QTimer, QSettings, QAbstractTableModel, QModelIndex,
+    QByteArray
 )
 from PyQt6.QtGui import (
-    QFont, QColor, QPalette, QIcon, QTextCursor
+    QFont, QColor, QPixmap, QTextCursor
 )
 
 import openpyxl
 from tra5_core import (
-    PMSConfig, PMSUpdateOrchestrator, ConfigLoader
+    PMSConfig, PMSUpdateOrchestrator
+)
+
+# python-calamine (اختیاری) برای خواندن سریع شیت‌ها و ستون B فایل PNT
+try:
+    from python_calamine import CalamineWorkbook
+except ImportError:
+    CalamineWorkbook = None
+
+logger = logging.getLogger(__name__)
+
+# فایل لاگ traceback خطاها (کنسول UI فقط متن خطا را نشان می‌دهد)
+LOG_FILE = "pms_updater.log"
+
+# برچسب نوع تغییر در جداول (یک شیء رشته مشترک برای همه ردیف‌ها)
+NEW_ITEM_LABEL = "🆕 جدید"
+UPDATED_ITEM_LABEL = "✅ آپدیت"
+
+# متن‌های ثابت تب درباره (یک بار در زمان import ساخته می‌شوند)
+_DESC_TEXT = (
+    "سیستم به‌روزرسانی خودکار فایل PMS از PNT-G\n\n"
+    "✅ استخراج خودکار آیتم‌ها\n"
+    "✅ تطبیق هوشمند با ساختار سلسله‌مراتبی\n"
+    "✅ درج و آپدیت خودکار\n"
+    "✅ Cache برای سرعت بالا\n"
+    "✅ رابط کاربری PyQt6"
+)
+_DEV_TEXT = (
+    "💻 توسعه‌دهنده: Hossein Izadi"
+    "📅 تاریخ: 1404/09/09\n"
+    "🔧  Python 3.11 | PyQt6 | openpyxl | win32com"
+)
+_HELP_TEXT = (
+    "1️⃣ فایل PMS و PNT را انتخاب کنید\n"
+    "2️⃣ شیت‌های مورد نظر را تعیین کنید\n"
+    "3️⃣ تنظیمات را بررسی کنید (محدوده محورها، Cache)\n"
+    "4️⃣ برای تست ابتدا Dry Run را فعال کنید\n"
+    "5️⃣ دکمه 'شروع پردازش' را بزنید\n"
+    "6️⃣ نتایج را در تب 'گزارش‌ها' مشاهده کنید"
 )
 
 # ================================================================================
@@ -164,7 +204,7 @@ QGroupBox::title {
     padding: 0 5px;
 }
 
-QTextEdit {
+QPlainTextEdit {
     background-color: #1e1e1e;
     color: #d4d4d4;
     border: 1px solid #3c3c3c;
@@ -173,7 +213,7 @@ QTextEdit {
     font-size: 9pt;
 }
 
-QTableWidget {
+QTableView {
     background-color: #1e1e1e;
     alternate-background-color: #252525;
     gridline-color: #3c3c3c;
@@ -181,12 +221,12 @@ QTableWidget {
     border-radius: 4px;
 }
 
-QTableWidget::item {
+QTableView::item {
     padding: 5px;
     color: #d4d4d4;
 }
 
-QTableWidget::item:selected {
+QTableView::item:selected {
     background-color: #007acc;
     color: white;
 }
@@ -204,7 +244,43 @@ QLabel {
 }
 
 QLabel#titleLabel {
-    font-size: 14pt;
+    font-size: 20pt;
+    font-weight: bold;
+    color: #007acc;
+}
+
+QLabel#versionLabel {
+    font-size: 12pt;
+    color: #d4d4d4;
+}
+
+QLabel#descLabel {
+    font-size: 10pt;
+    line-height: 1.6;
+}
+
+QLabel#devLabel {
+    font-size: 9pt;
+    color: #808080;
+}
+
+QLabel#helpText {
+    font-size: 9pt;
+    line-height: 1.8;
+}
+
+QLabel#cachePathLabel {
+    font-size: 8pt;
+    color: #808080;
+}
+
+QLabel#summaryLabel {
+    font-size: 11pt;
+    padding: 5px;
+}
+
+QLabel#changesInfoLabel {
+    font-size: 11pt;
     font-weight: bold;
     color: #007acc;
 }
@@ -283,7 +359,8 @@ class ProcessWorker(QThread):
             self.finished.emit(formatted_results)
 
         except Exception as e:
-            error_msg = f"❌ خطا: {str(e)}"
+            logger.exception("process failed")
+            error_msg = f"❌ خطا: {str(e)} (جزئیات در {LOG_FILE})"
             self.log_message.emit(error_msg, "error")
             self.error_occurred.emit(str(e))
 
@@ -343,23 +420,149 @@ class ProcessWorker(QThread):
                                                                                   int) else len(warnings_list),
             'unidentified_axis': results.get('unidentified_axis', len(unidentified_list)),
             'updates_list': updates_list,
+            'updates_columns': self._updates_columns(updates_list),
             'not_found_list': not_found_list,
             'warnings_list': warnings_list,
             'unidentified_list': unidentified_list,
             'dry_run': results.get('dry_run', False)
         }
 
+    @staticmethod
+    def _updates_columns(updates_list: List[Dict]) -> Dict[str, list]:
+        """
+        تبدیل لیست به‌روزرسانی‌ها به ستون‌های آماده نمایش (یک عبور، در thread کارگر)
+
+        Args:
+            updates_list: لیست دیکشنری‌های به‌روزرسانی
+
+        Returns:
+            {نام ستون: لیست مقادیر} - همه لیست‌ها هم‌طول و هم‌ترتیب updates_list
+        """
+        columns = {key: [] for key in ('mohor', 'item_text', 'a_value', 'e_value',
+                                       'n_value', 'rows_text', 'is_new_item')}
+
+        for update in updates_list:
+            columns['mohor'].append(update.get('mohor', ''))
+            columns['item_text'].append(update.get('item_text', update.get('a_value', '')))
+            columns['a_value'].append(update.get('a_value', ''))
+            columns['e_value'].append(str(update.get('e_value', '')))
+            columns['n_value'].append(str(update.get('n_value', '')))
+            columns['rows_text'].append(', '.join(map(str, update.get('existing_rows', []))))
+            columns['is_new_item'].append(bool(update.get('is_new_item', False)))
+
+        return columns
+
     def cancel(self):
         """لغو پردازش"""
         self.is_cancelled = True
         self.log_message.emit("⏸️ پردازش لغو شد", "warning")
 
 
+class PntScanWorker(QThread):
+    """Thread جداگانه برای خواندن شیت‌ها و محدوده فایل PNT (بدون فریز شدن UI)"""
+
+    # سیگنال‌ها
+    scanned = pyqtSignal(tuple, list, str, object)  # (کلید فایل، شیت‌ها، شیت، (اول، آخر))
+    scan_failed = pyqtSignal(tuple, str)  # (کلید فایل، خطا)
+
+    def __init__(self, pnt_file: str, key: tuple, sheet: Optional[str], default_sheet: str):
+        super().__init__()
+        self.pnt_file = pnt_file
+        self.key = key
+        self.sheet = sheet
+        self.default_sheet = default_sheet
+
+    def run(self):
+        """باز کردن فایل (یک بار)، خواندن لیست شیت‌ها و محدوده شیت خواسته شده"""
+        try:
+            if CalamineWorkbook is not None:
+                sheets, sheet, number_range = self._scan_calamine()
+            else:
+                sheets, sheet, number_range = self._scan_openpyxl()
+
+            self.scanned.emit(self.key, sheets, sheet, number_range)
+
+        except Exception as e:
+            self.scan_failed.emit(self.key, str(e))
+
+    def _target_sheet(self, sheets: List[str]) -> str:
+        """بدون شیت مشخص: شیت پیش‌فرض (یا اولین شیت) در همین بار خوانده می‌شود"""
+        if self.sheet is not None:
+            return self.sheet
+        return self.default_sheet if self.default_sheet in sheets else next(iter(sheets), '')
+
+    def _scan_openpyxl(self) -> tuple:
+        """
+        خواندن با openpyxl (read-only)
+
+        Returns:
+            (sheets, sheet, number_range)
+        """
+        wb = openpyxl.load_workbook(self.pnt_file, read_only=True, data_only=True)
+        try:
+            sheets = wb.sheetnames
+            sheet = self._target_sheet(sheets)
+
+            number_range = None
+            if sheet in sheets:
+                # یک عبور streaming، بدون ws.cell در هر ردیف
+                col_b = wb[sheet].iter_rows(min_col=2, max_col=2, values_only=True)
+                number_range = self._scan_number_range(val for val, in col_b)
+        finally:
+            wb.close()
+
+        return sheets, sheet, number_range
+
+    def _scan_calamine(self) -> tuple:
+        """
+        خواندن با python-calamine (parser مبتنی بر Rust)
+
+        Returns:
+            (sheets, sheet, number_range)
+        """
+        wb = CalamineWorkbook.from_path(self.pnt_file)
+        try:
+            sheets = list(wb.sheet_names)
+            sheet = self._target_sheet(sheets)
+
+            number_range = None
+            if sheet in sheets:
+                # skip_empty_area=False تا اندیس سطرها از ردیف 1 شروع شود
+                rows = wb.get_sheet_by_name(sheet).to_python(skip_empty_area=False)
+                number_range = self._scan_number_range(row[1] if len(row) > 1 else None for row in rows)
+        finally:
+            wb.close()
+
+        return sheets, sheet, number_range
+
+    @staticmethod
+    def _scan_number_range(col_b) -> tuple:
+        """
+        جستجوی اولین و آخرین ردیف عددی در ستون B
+
+        Args:
+            col_b: مقادیر ستون B به ترتیب ردیف (از ردیف 1)
+
+        Returns:
+            (first_row, last_row) یا (None, None)
+        """
+        first_num = None
+        last_num = None
+
+        for row, val in enumerate(col_b, start=1):
+            if isinstance(val, (int, float)):
+                if first_num is None:
+                    first_num = row
+                last_num = row
+
+        return first_num, last_num
+
+
 # ================================================================================
 # 🎨 کنسول سفارشی
 # ================================================================================
 
-class ConsoleWidget(QTextEdit):
+class ConsoleWidget(QPlainTextEdit):
     """ویجت کنسول با رنگ‌بندی خاص"""
 
     def __init__(self):
@@ -368,6 +571,9 @@ class ConsoleWidget(QTextEdit):
         self.setMaximumHeight(200)
         self.setFont(QFont("Consolas", 9))
 
+        # فقط آخرین 5000 خط (هر خط یک بلوک) نگه داشته می‌شود (سند با لاگ‌های طولانی بزرگ نمی‌شود)
+        self.setMaximumBlockCount(5000)
+
         # رنگ‌ها
         self.colors = {
             'info': '#569cd6',  # آبی
@@ -377,21 +583,65 @@ class ConsoleWidget(QTextEdit):
             'default': '#d4d4d4'  # خاکستری
         }
 
+        # پیام‌ها با تاخیر کوتاه یکجا اضافه می‌شوند (هر append یک re-layout کامل دارد)
+        self._pending: List[str] = []
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(50)
+        self._flush_timer.timeout.connect(self._flush_pending)
+
     def append_message(self, message: str, msg_type: str = 'default'):
         """افزودن پیام با رنگ مناسب"""
         timestamp = datetime.now().strftime("%H:%M:%S")
         color = self.colors.get(msg_type, self.colors['default'])
 
-        html = f'<span style="color: {color}">[{timestamp}] {message}</span>'
-        self.append(html)
+        # پیام‌های چندخطی (لاگ بافر شده) خط به خط و هر خط در یک بلوک جدا نمایش داده
+        # می‌شوند تا setMaximumBlockCount تعداد خطوط را محدود کند
+        lines = message.strip('\n').split('\n')
+        lines[0] = f'[{timestamp}] {lines[0]}'
+        self._pending.extend(f'<span style="color: {color}">{line}</span>' for line in lines)
+
+        if not self._flush_timer.isActive():
+            self._flush_timer.start()
+
+    def _flush_pending(self):
+        """افزودن خطوط در صف به کنسول در یک edit block (هر خط یک بلوک)"""
+        if not self._pending:
+            return
+
+        # اسکرول خودکار فقط اگر کاربر در انتهای کنسول باشد
+        scroll_bar = self.verticalScrollBar()
+        at_bottom = scroll_bar.value() == scroll_bar.maximum()
 
-        # اسکرول به پایین
-        cursor = self.textCursor()
+        document = self.document()
+        cursor = QTextCursor(document)
         cursor.movePosition(QTextCursor.MoveOperation.End)
-        self.setTextCursor(cursor)
+
+        # یک edit block: layout و حذف بلوک‌های اضافی یک بار در پایان انجام می‌شود
+        cursor.beginEditBlock()
+        new_block = not document.isEmpty()
+        for html in self._pending:
+            if new_block:
+                cursor.insertBlock()
+            cursor.insertHtml(html)
+            new_block = True
+        cursor.endEditBlock()
+        self._pending = []
+
+        if at_bottom:
+            scroll_bar.setValue(scroll_bar.maximum())
+
+    def contextMenuEvent(self, event):
+        """منوی راست‌کلیک استاندارد به همراه گزینه پاک کردن کنسول"""
+        menu = self.createStandardContextMenu()
+        menu.addSeparator()
+        menu.addAction("🧹 پاک کردن کنسول", self.clear_console)
+        menu.exec(event.globalPos())
+        menu.deleteLater()
 
     def clear_console(self):
         """پاک کردن کنسول"""
+        self._pending = []
         self.clear()
         self.append_message("کنسول پاک شد", "info")
 
@@ -409,6 +659,17 @@ class ExecuteTab(QWidget):
         self.config = parent_window.config
         self.worker = None
 
+        # Cache فایل‌های PNT: {(مسیر, mtime, size): {'sheets': [...], 'ranges': {شیت: (اول, آخر)}}}
+        self._pnt_cache: Dict[tuple, Dict] = {}
+        self._pnt_workers: List[PntScanWorker] = []
+        self._pnt_sheets_key: Optional[tuple] = None  # فایلی که لیست شیت‌هایش در انتظار است
+
+        # تغییر مسیر PNT با تاخیر بررسی می‌شود (نه با هر کلید تایپ شده)
+        self._pnt_debounce = QTimer(self)
+        self._pnt_debounce.setSingleShot(True)
+        self._pnt_debounce.setInterval(300)
+        self._pnt_debounce.timeout.connect(self.on_pnt_file_changed)
+
         self.init_ui()
 
         # ✅ اضافه کردن اتصالات
@@ -419,15 +680,15 @@ class ExecuteTab(QWidget):
         # ✅ وقتی شیت عوض شد، محدوده رو شناسایی کن
         self.pnt_sheet_combo.currentTextChanged.connect(self.detect_pnt_range)
 
-        # ✅ وقتی فایل PNT عوض شد، مستقیم شیت‌ها رو بارگذاری کن
-        self.pnt_file_input.textChanged.connect(self.on_pnt_file_changed)
+        # ✅ وقتی فایل PNT عوض شد (و تایپ متوقف شد)، شیت‌ها رو بارگذاری کن
+        self.pnt_file_input.textChanged.connect(self._pnt_debounce.start)
 
     def on_pnt_file_changed(self):
         """وقتی فایل PNT تغییر کرد"""
         pnt_file = self.pnt_file_input.text()
 
         # چک کن فایل معتبر هست
-        if os.path.exists(pnt_file) and pnt_file.endswith(('.xlsx', '.xls')):
+        if pnt_file.endswith(('.xlsx', '.xls')) and os.path.isfile(pnt_file):
             # مستقیما شیت‌ها رو بارگذاری کن
             self.load_pnt_sheets()
 
@@ -508,7 +769,7 @@ class ExecuteTab(QWidget):
         self.use_cache_checkbox.setChecked(self.config.USE_CACHE)
         settings_layout.addWidget(self.use_cache_checkbox, 1, 0)
         self.cache_path_label = QLabel(f"📍 {self.config.CACHE_FILE}")
-        self.cache_path_label.setStyleSheet("color: #808080; font-size: 8pt;")
+        self.cache_path_label.setObjectName("cachePathLabel")
         settings_layout.addWidget(self.cache_path_label, 1, 1)
 
         # Dry Run
@@ -562,12 +823,17 @@ class ExecuteTab(QWidget):
         stats_group = QGroupBox("📈 آمار لحظه‌ای")
         stats_layout = QHBoxLayout()
 
+        # عنوان ثابت هر آمار (متن برچسب = "عنوان: مقدار")
+        self._stats_templates = {
+            'processed': "✅ پردازش شده",
+            'new': "🆕 جدید",
+            'error': "❌ خطا",
+            'warning': "⚠️ هشدار",
+            'skipped': "⏭️ رد شده"
+        }
+
         self.stats_labels = {
-            'processed': QLabel("✅ پردازش شده: 0"),
-            'new': QLabel("🆕 جدید: 0"),
-            'error': QLabel("❌ خطا: 0"),
-            'warning': QLabel("⚠️ هشدار: 0"),
-            'skipped': QLabel("⏭️ رد شده: 0")
+            key: QLabel(f"{prefix}: 0") for key, prefix in self._stats_templates.items()
         }
 
         for label in self.stats_labels.values():
@@ -594,102 +860,177 @@ class ExecuteTab(QWidget):
         )
         if file_path:
             self.pnt_file_input.setText(file_path)
+            self._pnt_debounce.stop()
             self.load_pnt_sheets()
 
     def load_pnt_sheets(self):
         """بارگذاری لیست شیت‌های PNT"""
         pnt_file = self.pnt_file_input.text()
 
-        if not os.path.exists(pnt_file):
+        # وجود فایل و کلید Cache با یک stat
+        key = self._pnt_file_key(pnt_file)
+        if key is None:
             self.parent_window.console.append_message(
                 f"⚠️ فایل PNT یافت نشد: {pnt_file}", "warning"
             )
             return
 
-        try:
-            wb = openpyxl.load_workbook(pnt_file, read_only=True, data_only=True)
-            sheets = wb.sheetnames
-            wb.close()
-
-            # ✅ پاک کردن ComboBox قبل از اضافه کردن
-            self.pnt_sheet_combo.blockSignals(True)  # جلوگیری از ترایگر شدن سیگنال
-            self.pnt_sheet_combo.clear()
-            self.pnt_sheet_combo.addItems(sheets)
-            self.pnt_sheet_combo.blockSignals(False)
-
-            # ✅ اگه شیت پیش‌فرض وجود داره، انتخابش کن
-            default_sheet = self.config.PNT_SHEET
-            index = self.pnt_sheet_combo.findText(default_sheet)
-            if index >= 0:
-                self.pnt_sheet_combo.setCurrentIndex(index)
+        pnt_data = self._pnt_cache.get(key)
 
-            # ✅ شناسایی خودکار محدوده برای اولین شیت
-            self.detect_pnt_range()
-
-            self.parent_window.console.append_message(
-                f"✅ {len(sheets)} شیت یافت شد", "success"
-            )
-        except Exception as e:
-            self.parent_window.console.append_message(
-                f"❌ خطا در خواندن شیت‌ها: {e}", "error"
-            )
+        if pnt_data is not None:
+            self._show_pnt_sheets(pnt_data['sheets'])
+        else:
+            # لیست شیت‌ها و محدوده شیت پیش‌فرض در thread جداگانه خوانده می‌شوند
+            self._pnt_sheets_key = key
+            self._start_pnt_scan(pnt_file, key, None)
+
+    def _show_pnt_sheets(self, sheets: List[str]):
+        """پر کردن ComboBox شیت‌ها و شناسایی محدوده شیت انتخاب شده"""
+        # ✅ پاک کردن ComboBox قبل از اضافه کردن
+        self.pnt_sheet_combo.blockSignals(True)  # جلوگیری از ترایگر شدن سیگنال
+        self.pnt_sheet_combo.clear()
+        self.pnt_sheet_combo.addItems(sheets)
+        self.pnt_sheet_combo.blockSignals(False)
+
+        # ✅ اگه شیت پیش‌فرض وجود داره، انتخابش کن
+        default_sheet = self.config.PNT_SHEET
+        index = self.pnt_sheet_combo.findText(default_sheet)
+        if index >= 0:
+            self.pnt_sheet_combo.setCurrentIndex(index)
+
+        # ✅ شناسایی خودکار محدوده برای اولین شیت
+        self.detect_pnt_range()
+
+        self.parent_window.console.append_message(
+            f"✅ {len(sheets)} شیت یافت شد", "success"
+        )
 
     def detect_pnt_range(self):
         """شناسایی خودکار محدوده ردیف‌های PNT از ستون B"""
         pnt_file = self.pnt_file_input.text()
         pnt_sheet = self.pnt_sheet_combo.currentText()
 
-        if not os.path.exists(pnt_file) or not pnt_sheet:
+        if not pnt_sheet:
             return
 
-        try:
+        key = self._pnt_file_key(pnt_file)
+        if key is None:
+            return
+        pnt_data = self._pnt_cache.get(key)
+
+        if pnt_data is not None and pnt_sheet in pnt_data['ranges']:
+            self._show_pnt_range(pnt_sheet, pnt_data['ranges'][pnt_sheet])
+        elif pnt_data is not None and pnt_sheet not in pnt_data['sheets']:
+            self._show_pnt_range_error(f"Worksheet {pnt_sheet} does not exist.")
+        else:
             self.parent_window.console.append_message(
                 f"🔍 شناسایی محدوده از شیت '{pnt_sheet}'...", "info"
             )
+            self._start_pnt_scan(pnt_file, key, pnt_sheet)
 
-            wb = openpyxl.load_workbook(pnt_file, read_only=True, data_only=True)
-            ws = wb[pnt_sheet]
+    def _show_pnt_range(self, pnt_sheet: str, number_range: tuple):
+        """نمایش محدوده شناسایی شده و به‌روزرسانی config"""
+        first_num, last_num = number_range
 
-            first_num = None
-            last_num = None
+        if first_num and last_num:
+            range_text = f"محدوده: ردیف {first_num} تا {last_num} (شناسایی خودکار)"
+            self.auto_range_label.setText(range_text)
+            self.auto_range_label.setStyleSheet("color: #4ec9b0; font-style: italic; font-weight: bold;")
 
-            # جستجوی اولین و آخرین عدد در ستون B
-            for row in range(1, ws.max_row + 1):
-                val = ws.cell(row, 2).value  # ستون B
-                if isinstance(val, (int, float)):
-                    if first_num is None:
-                        first_num = row
-                    last_num = row
+            self.parent_window.console.append_message(
+                f"✅ {range_text}", "success"
+            )
 
-            wb.close()
+            # به‌روزرسانی config
+            self.config.PNT.ROW_START = first_num
+            self.config.PNT.ROW_END = last_num + 1
+        else:
+            self.auto_range_label.setText("محدوده: شناسایی نشد ❌")
+            self.auto_range_label.setStyleSheet("color: #f48771; font-style: italic;")
 
-            if first_num and last_num:
-                range_text = f"محدوده: ردیف {first_num} تا {last_num} (شناسایی خودکار)"
-                self.auto_range_label.setText(range_text)
-                self.auto_range_label.setStyleSheet("color: #4ec9b0; font-style: italic; font-weight: bold;")
+            self.parent_window.console.append_message(
+                "⚠️ هیچ عددی در ستون B یافت نشد", "warning"
+            )
 
-                self.parent_window.console.append_message(
-                    f"✅ {range_text}", "success"
-                )
+    def _show_pnt_range_error(self, error_msg: str):
+        """نمایش خطای شناسایی محدوده"""
+        self.auto_range_label.setText(f"خطا: {error_msg}")
+        self.auto_range_label.setStyleSheet("color: #f48771; font-style: italic;")
 
-                # به‌روزرسانی config
-                self.config.PNT.ROW_START = first_num
-                self.config.PNT.ROW_END = last_num + 1
-            else:
-                self.auto_range_label.setText("محدوده: شناسایی نشد ❌")
-                self.auto_range_label.setStyleSheet("color: #f48771; font-style: italic;")
+        self.parent_window.console.append_message(
+            f"❌ خطا در شناسایی محدوده: {error_msg}", "error"
+        )
 
-                self.parent_window.console.append_message(
-                    "⚠️ هیچ عددی در ستون B یافت نشد", "warning"
-                )
+    @staticmethod
+    def _pnt_file_key(pnt_file: str) -> Optional[tuple]:
+        """کلید Cache فایل PNT (مسیر مطلق، زمان تغییر، اندازه) یا None اگر فایل وجود ندارد"""
+        try:
+            stat = os.stat(pnt_file)
+        except (OSError, ValueError):
+            return None
+        if not S_ISREG(stat.st_mode):
+            return None
+        return os.path.abspath(pnt_file), stat.st_mtime_ns, stat.st_size
+
+    def _start_pnt_scan(self, pnt_file: str, key: tuple, sheet: Optional[str]):
+        """شروع خواندن فایل PNT در thread جداگانه"""
+        # همان درخواست در حال اجراست (مثلاً textChanged و browse پشت سر هم)
+        if any(w.key == key and w.sheet == sheet for w in self._pnt_workers):
+            return
 
-        except Exception as e:
-            self.auto_range_label.setText(f"خطا: {str(e)}")
-            self.auto_range_label.setStyleSheet("color: #f48771; font-style: italic;")
+        worker = PntScanWorker(pnt_file, key, sheet, self.config.PNT_SHEET)
+        queued = Qt.ConnectionType.QueuedConnection
+        worker.scanned.connect(self._on_pnt_scanned, queued)
+        worker.scan_failed.connect(self._on_pnt_scan_failed, queued)
+        worker.finished.connect(self._on_pnt_worker_finished, queued)
+
+        # نگه داشتن ارجاع تا پایان thread
+        self._pnt_workers.append(worker)
+        worker.start()
+
+    def _on_pnt_worker_finished(self):
+        """رها کردن ارجاع thread تمام شده"""
+        worker = self.sender()
+        if worker in self._pnt_workers:
+            # سیگنال finished کمی قبل از خروج کامل run() ارسال می‌شود؛ تا پایان واقعی
+            # thread صبر می‌شود تا با رها شدن آخرین ارجاع، QThread در حال اجرا حذف نشود
+            worker.wait()
+            self._pnt_workers.remove(worker)
+
+    def _on_pnt_scanned(self, key: tuple, sheets: List[str], sheet: str, number_range: Optional[tuple]):
+        """ذخیره نتیجه خواندن PNT در Cache و نمایش آن (در thread اصلی)"""
+        pnt_data = self._pnt_cache.get(key)
+        if pnt_data is None:
+            pnt_data = {'sheets': sheets, 'ranges': {}}
+
+            # فقط چند فایل اخیر نگه داشته می‌شوند
+            if len(self._pnt_cache) >= 4:
+                del self._pnt_cache[next(iter(self._pnt_cache))]
+            self._pnt_cache[key] = pnt_data
+
+        if number_range is not None:
+            pnt_data['ranges'][sheet] = number_range
+
+        # نتیجه فایلی که دیگر انتخاب نشده فقط در Cache می‌ماند
+        pnt_file = self.pnt_file_input.text()
+        if self._pnt_file_key(pnt_file) != key:
+            return
+
+        if key == self._pnt_sheets_key:
+            self._pnt_sheets_key = None
+            self._show_pnt_sheets(sheets)
+        elif sheet == self.pnt_sheet_combo.currentText():
+            self.detect_pnt_range()
 
+    def _on_pnt_scan_failed(self, key: tuple, error_msg: str):
+        """نمایش خطای خواندن فایل PNT"""
+        if key == self._pnt_sheets_key:
+            self._pnt_sheets_key = None
             self.parent_window.console.append_message(
-                f"❌ خطا در شناسایی محدوده: {e}", "error"
+                f"❌ خطا در خواندن شیت‌ها: {error_msg}", "error"
             )
+        else:
+            self._show_pnt_range_error(error_msg)
 
     def stop_processing(self):
         """توقف پردازش"""
@@ -726,8 +1067,8 @@ class ExecuteTab(QWidget):
         self.progress_bar.setValue(0)
         self.progress_text.setText("آماده")
 
-        for label in self.stats_labels.values():
-            label.setText(label.text().split(':')[0] + ": 0")
+        for key in self.stats_labels:
+            self._set_stat(key, 0)
 
         self.parent_window.console.append_message("🔄 تنظیم مجدد انجام شد", "info")
 
@@ -748,21 +1089,26 @@ class ExecuteTab(QWidget):
         dry_run = self.dry_run_checkbox.isChecked()
         self.worker = ProcessWorker(self.config, dry_run)
 
-        # اتصال سیگنال‌ها
-        self.worker.progress_updated.connect(self.update_progress)
-        self.worker.log_message.connect(self.parent_window.console.append_message)
-        self.worker.finished.connect(self.processing_finished)
-        self.worker.error_occurred.connect(self.processing_error)
-        self.worker.stats_updated.connect(self.update_live_stats)  # جدید
+        # اتصال سیگنال‌ها (همه از thread کارگر به thread اصلی: صریحاً Queued)
+        queued = Qt.ConnectionType.QueuedConnection
+        self.worker.progress_updated.connect(self.update_progress, queued)
+        self.worker.log_message.connect(self.parent_window.console.append_message, queued)
+        self.worker.finished.connect(self.processing_finished, queued)
+        self.worker.error_occurred.connect(self.processing_error, queued)
+        self.worker.stats_updated.connect(self.update_live_stats, queued)  # جدید
 
         self.worker.start()
 
     def update_live_stats(self, stats: Dict):
         """به‌روزرسانی آمار لحظه‌ای"""
-        self.stats_labels['processed'].setText(f"✅ پردازش شده: {stats.get('processed', 0)}")
-        self.stats_labels['new'].setText(f"🆕 جدید: {stats.get('inserted', 0)}")
-        self.stats_labels['error'].setText(f"❌ خطا: {stats.get('failed', 0)}")
-        self.stats_labels['warning'].setText(f"⚠️ هشدار: {stats.get('warnings', 0)}")
+        self._set_stat('processed', stats.get('processed', 0))
+        self._set_stat('new', stats.get('inserted', 0))
+        self._set_stat('error', stats.get('failed', 0))
+        self._set_stat('warning', stats.get('warnings', 0))
+
+    def _set_stat(self, key: str, value: Any):
+        """نمایش مقدار یک آمار با عنوان ثابت آن"""
+        self.stats_labels[key].setText(f"{self._stats_templates[key]}: {value}")
 
     def processing_finished(self, results: Dict):
         """پایان پردازش"""
@@ -770,17 +1116,16 @@ class ExecuteTab(QWidget):
         self.stop_btn.setEnabled(False)
 
         # به‌روزرسانی آمار نهایی
-        existing = sum(1 for u in results.get('updates_list', []) if not u.get('is_new_item', False))
-        new = sum(1 for u in results.get('updates_list', []) if u.get('is_new_item', False))
+        new = sum(results['updates_columns']['is_new_item'])
 
-        self.stats_labels['processed'].setText(f"✅ پردازش شده: {results.get('processed', 0)}")
-        self.stats_labels['new'].setText(f"🆕 جدید: {new}")
-        self.stats_labels['error'].setText(f"❌ خطا: {results.get('not_found', 0)}")
-        self.stats_labels['warning'].setText(f"⚠️ هشدار: {results.get('warnings', 0)}")
+        self._set_stat('processed', results.get('processed', 0))
+        self._set_stat('new', new)
+        self._set_stat('error', results.get('not_found', 0))
+        self._set_stat('warning', results.get('warnings', 0))
 
         # نمایش در تب‌های گزارش و تغییرات
         self.parent_window.reports_tab.load_results(results)
-        self.parent_window.changes_tab.load_changes(results.get('updates_list', []))
+        self.parent_window.changes_tab.load_changes(results['updates_columns'])
 
         # پیغام Dry Run
         if results.get('dry_run', False):
@@ -793,6 +1138,63 @@ class ExecuteTab(QWidget):
             )
 
 
+# ================================================================================
+# 🗂️ مدل جدول
+# ================================================================================
+
+class RowsTableModel(QAbstractTableModel):
+    """
+    مدل فقط‌خواندنی روی لیست ردیف‌های آماده (بدون ساخت item برای هر سلول)
+
+    ستون اول شماره ردیف است و بقیه ستون‌ها به ترتیب از تاپل هر ردیف خوانده
+    می‌شوند (عناصر اضافه تاپل نمایش داده نمی‌شوند).
+    """
+
+    def __init__(self, headers: List[str], foreground=None, parent=None):
+        """
+        Args:
+            headers: عنوان ستون‌ها (شامل ستون شماره ردیف)
+            foreground: تابع (ردیف، ستون) -> QColor یا None برای رنگ متن
+            parent: والد Qt
+        """
+        super().__init__(parent)
+        self._headers = headers
+        self._foreground = foreground
+        self._rows: List[tuple] = []
+
+    def set_rows(self, rows: List[tuple]):
+        """جایگزینی کامل داده‌ها با یک reset"""
+        self.beginResetModel()
+        self._rows = rows
+        self.endResetModel()
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._headers)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        row = index.row()
+        col = index.column()
+
+        if role == Qt.ItemDataRole.DisplayRole:
+            # شماره ردیف به صورت عدد (بدون ساخت رشته و با مرتب‌سازی عددی)
+            return row + 1 if col == 0 else self._rows[row][col - 1]
+
+        if role == Qt.ItemDataRole.ForegroundRole and self._foreground is not None:
+            return self._foreground(self._rows[row], col)
+
+        return None
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role != Qt.ItemDataRole.DisplayRole:
+            return None
+        if orientation == Qt.Orientation.Horizontal:
+            return self._headers[section]
+        return section + 1
+
+
 # ================================================================================
 # 📊 تب 2: گزارش‌ها
 # ================================================================================
@@ -822,7 +1224,7 @@ class ReportsTab(QWidget):
 
         row = 0
         for label in self.summary_labels.values():
-            label.setStyleSheet("font-size: 11pt; padding: 5px;")
+            label.setObjectName("summaryLabel")
             summary_layout.addWidget(label, row, 0)
             row += 1
 
@@ -873,11 +1275,10 @@ class ReportsTab(QWidget):
 
         self.setLayout(layout)
 
-    def create_table(self) -> QTableWidget:
+    def create_table(self) -> QTableView:
         """ساخت یک جدول خالی"""
-        table = QTableWidget()
-        table.setColumnCount(4)
-        table.setHorizontalHeaderLabels(["ردیف", "محور", "آیتم", "جزئیات"])
+        table = QTableView()
+        table.setModel(RowsTableModel(["ردیف", "محور", "آیتم", "جزئیات"], parent=table))
         table.setAlternatingRowColors(True)
         table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
         table.horizontalHeader().setStretchLastSection(True)
@@ -887,9 +1288,9 @@ class ReportsTab(QWidget):
     def load_results(self, results: Dict):
         """بارگذاری نتایج در جداول"""
         # به‌روزرسانی خلاصه
-        updates_list = results.get('updates_list', [])
-        existing_count = sum(1 for u in updates_list if not u.get('is_new_item', False))
-        new_count = sum(1 for u in updates_list if u.get('is_new_item', False))
+        updates_columns = results['updates_columns']
+        new_count = sum(updates_columns['is_new_item'])
+        existing_count = len(updates_columns['is_new_item']) - new_count
 
         self.summary_labels['updated'].setText(f"✅ موجود آپدیت شده: {existing_count}")
         self.summary_labels['inserted'].setText(f"🆕 جدید درج شده: {new_count}")
@@ -898,75 +1299,44 @@ class ReportsTab(QWidget):
         self.summary_labels['unidentified'].setText(f"🔍 بدون محور: {results.get('unidentified_axis', 0)}")
 
         # پر کردن جداول
-        self._fill_success_table(updates_list)
+        self._fill_success_table(updates_columns)
         self._fill_failed_table(results.get('not_found_list', []))
         self._fill_warning_table(results.get('warnings_list', []))
         self._fill_unidentified_table(results.get('unidentified_list', []))
 
-    def _fill_success_table(self, updates_list: List[Dict]):
+    def _fill_success_table(self, updates_columns: Dict[str, list]):
         """پر کردن جدول موفق"""
-        self.success_table.setRowCount(0)
-
-        for idx, update in enumerate(updates_list):
-            row_pos = self.success_table.rowCount()
-            self.success_table.insertRow(row_pos)
-
-            # ردیف
-            self.success_table.setItem(row_pos, 0, QTableWidgetItem(str(idx + 1)))
-
-            # محور
-            self.success_table.setItem(row_pos, 1, QTableWidgetItem(update.get('mohor', '')))
-
-            # آیتم
-            item_text = update.get('item_text', update.get('a_value', ''))
-            self.success_table.setItem(row_pos, 2, QTableWidgetItem(item_text))
-
-            # جزئیات
-            is_new = update.get('is_new_item', False)
-            rows_str = ', '.join(map(str, update.get('existing_rows', [])))
-            detail = f"{'🆕 جدید' if is_new else '✅ آپدیت'} | ردیف‌ها: {rows_str}"
-            self.success_table.setItem(row_pos, 3, QTableWidgetItem(detail))
+        self.success_table.model().set_rows([
+            (mohor, item_text, f"{NEW_ITEM_LABEL if is_new else UPDATED_ITEM_LABEL} | ردیف‌ها: {rows_text}")
+            for mohor, item_text, is_new, rows_text in zip(
+                updates_columns['mohor'], updates_columns['item_text'],
+                updates_columns['is_new_item'], updates_columns['rows_text']
+            )
+        ])
 
     def _fill_failed_table(self, not_found_list: List[Dict]):
         """پر کردن جدول ناموفق"""
-        self.failed_table.setRowCount(0)
-
-        for idx, item in enumerate(not_found_list):
-            row_pos = self.failed_table.rowCount()
-            self.failed_table.insertRow(row_pos)
-
-            self.failed_table.setItem(row_pos, 0, QTableWidgetItem(str(idx + 1)))
-            self.failed_table.setItem(row_pos, 1, QTableWidgetItem(item.get('mohor', '')))
-            self.failed_table.setItem(row_pos, 2, QTableWidgetItem(item.get('item', '')))
-            self.failed_table.setItem(row_pos, 3, QTableWidgetItem(item.get('reason', '')))
+        self.failed_table.model().set_rows([
+            (item.get('mohor', ''), item.get('item', ''), item.get('reason', ''))
+            for item in not_found_list
+        ])
 
     def _fill_warning_table(self, warnings_list: List[Dict]):
         """پر کردن جدول هشدار"""
-        self.warning_table.setRowCount(0)
-
-        for idx, warning in enumerate(warnings_list):
-            row_pos = self.warning_table.rowCount()
-            self.warning_table.insertRow(row_pos)
-
-            self.warning_table.setItem(row_pos, 0, QTableWidgetItem(str(idx + 1)))
-            self.warning_table.setItem(row_pos, 1, QTableWidgetItem(warning.get('mohor', '')))
-            self.warning_table.setItem(row_pos, 2, QTableWidgetItem(warning.get('item', '')))
-
-            detail = f"نیاز: {warning.get('needed', 0)} | موجود: {warning.get('available', 0)} | کمبود: {warning.get('deficit', 0)}"
-            self.warning_table.setItem(row_pos, 3, QTableWidgetItem(detail))
+        self.warning_table.model().set_rows([
+            (
+                warning.get('mohor', ''), warning.get('item', ''),
+                f"نیاز: {warning.get('needed', 0)} | موجود: {warning.get('available', 0)} | کمبود: {warning.get('deficit', 0)}"
+            )
+            for warning in warnings_list
+        ])
 
     def _fill_unidentified_table(self, unidentified_list: List[Dict]):
         """پر کردن جدول بدون محور"""
-        self.unidentified_table.setRowCount(0)
-
-        for idx, item in enumerate(unidentified_list):
-            row_pos = self.unidentified_table.rowCount()
-            self.unidentified_table.insertRow(row_pos)
-
-            self.unidentified_table.setItem(row_pos, 0, QTableWidgetItem(str(idx + 1)))
-            self.unidentified_table.setItem(row_pos, 1, QTableWidgetItem("-"))
-            self.unidentified_table.setItem(row_pos, 2, QTableWidgetItem(item.get('item', '')))
-            self.unidentified_table.setItem(row_pos, 3, QTableWidgetItem(f"سطر PNT: {item.get('row', '')}"))
+        self.unidentified_table.model().set_rows([
+            ("-", item.get('item', ''), f"سطر PNT: {item.get('row', '')}")
+            for item in unidentified_list
+        ])
 
     def export_to_excel(self):
         """Export نتایج به Excel"""
@@ -997,6 +1367,10 @@ class ChangesTab(QWidget):
     def __init__(self):
         super().__init__()
         self.changes_data = []
+        # ردیف‌های آماده نمایش (یک بار در load_changes ساخته می‌شوند) و اندیس موجود/جدید
+        self._rows_prebuilt: List[tuple] = []
+        self._existing_idx: List[int] = []
+        self._new_idx: List[int] = []
         self.init_ui()
 
     def init_ui(self):
@@ -1005,7 +1379,7 @@ class ChangesTab(QWidget):
 
         # توضیحات
         info_label = QLabel("🔄 لیست کامل تغییرات اعمال شده")
-        info_label.setStyleSheet("font-size: 11pt; color: #007acc; font-weight: bold;")
+        info_label.setObjectName("changesInfoLabel")
         layout.addWidget(info_label)
 
         # فیلترها
@@ -1023,11 +1397,15 @@ class ChangesTab(QWidget):
         layout.addWidget(filter_group)
 
         # جدول تغییرات
-        self.changes_table = QTableWidget()
-        self.changes_table.setColumnCount(7)
-        self.changes_table.setHorizontalHeaderLabels([
-            "ردیف", "محور", "نوع", "آیتم", "مقدار E", "مقدار N", "ردیف‌های PMS"
-        ])
+        self.changes_table = QTableView()
+        new_item_color = QColor("#4ec9b0")
+        self.changes_model = RowsTableModel(
+            ["ردیف", "محور", "نوع", "آیتم", "مقدار E", "مقدار N", "ردیف‌های PMS"],
+            # رنگ ستون نوع برای آیتم‌های جدید (عنصر آخر تاپل = جدید؟)
+            foreground=lambda row, col: new_item_color if col == 2 and row[-1] else None,
+            parent=self.changes_table
+        )
+        self.changes_table.setModel(self.changes_model)
         self.changes_table.setAlternatingRowColors(True)
         self.changes_table.horizontalHeader().setStretchLastSection(True)
         self.changes_table.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
@@ -1043,15 +1421,35 @@ class ChangesTab(QWidget):
 
         self.setLayout(layout)
 
-    def load_changes(self, updates_list: List[Dict]):
-        """بارگذاری لیست تغییرات"""
-        self.changes_data = updates_list
+    def load_changes(self, updates_columns: Dict[str, list]):
+        """
+        بارگذاری لیست تغییرات
+
+        Args:
+            updates_columns: ستون‌های آماده به‌روزرسانی‌ها (از ProcessWorker)
+        """
+        self.changes_data = updates_columns
+        is_new_item = updates_columns['is_new_item']
+
+        # ردیف‌ها یک بار از ستون‌ها ساخته می‌شوند (نه در هر تغییر فیلتر)
+        self._rows_prebuilt = list(zip(
+            updates_columns['mohor'],
+            [NEW_ITEM_LABEL if is_new else UPDATED_ITEM_LABEL for is_new in is_new_item],
+            updates_columns['a_value'],
+            updates_columns['e_value'],
+            updates_columns['n_value'],
+            updates_columns['rows_text'],
+            is_new_item
+        ))
+        self._existing_idx = [idx for idx, is_new in enumerate(is_new_item) if not is_new]
+        self._new_idx = [idx for idx, is_new in enumerate(is_new_item) if is_new]
+
         self.apply_filter()
 
         # به‌روزرسانی آمار
-        total = len(updates_list)
-        existing = sum(1 for u in updates_list if not u.get('is_new_item', False))
-        new = sum(1 for u in updates_list if u.get('is_new_item', False))
+        total = len(is_new_item)
+        existing = len(self._existing_idx)
+        new = len(self._new_idx)
 
         self.stats_label.setText(f"📊 کل تغییرات: {total} | موجود: {existing} | جدید: {new}")
 
@@ -1060,34 +1458,22 @@ class ChangesTab(QWidget):
         filter_text = self.filter_combo.currentText()
 
         if filter_text == "همه":
-            filtered_data = self.changes_data
+            filtered_rows = self._rows_prebuilt
         elif "موجود" in filter_text:
-            filtered_data = [u for u in self.changes_data if not u.get('is_new_item', False)]
+            filtered_rows = [self._rows_prebuilt[idx] for idx in self._existing_idx]
         else:  # جدید
-            filtered_data = [u for u in self.changes_data if u.get('is_new_item', False)]
+            filtered_rows = [self._rows_prebuilt[idx] for idx in self._new_idx]
 
-        self._fill_table(filtered_data)
+        self._fill_table(filtered_rows)
 
-    def _fill_table(self, data: List[Dict]):
-        """پر کردن جدول"""
-        self.changes_table.setRowCount(len(data))
+    def _fill_table(self, rows: List[tuple]):
+        """
+        پر کردن جدول
 
-        for idx, update in enumerate(data):
-            self.changes_table.setItem(idx, 0, QTableWidgetItem(str(idx + 1)))
-            self.changes_table.setItem(idx, 1, QTableWidgetItem(update.get('mohor', '')))
-
-            change_type = "🆕 جدید" if update.get('is_new_item', False) else "✅ آپدیت"
-            type_item = QTableWidgetItem(change_type)
-            if update.get('is_new_item', False):
-                type_item.setForeground(QColor("#4ec9b0"))
-            self.changes_table.setItem(idx, 2, type_item)
-
-            self.changes_table.setItem(idx, 3, QTableWidgetItem(update.get('a_value', '')))
-            self.changes_table.setItem(idx, 4, QTableWidgetItem(str(update.get('e_value', ''))))
-            self.changes_table.setItem(idx, 5, QTableWidgetItem(str(update.get('n_value', ''))))
-
-            rows_str = ', '.join(map(str, update.get('existing_rows', [])))
-            self.changes_table.setItem(idx, 6, QTableWidgetItem(rows_str))
+        Args:
+            rows: ردیف‌های آماده (محور، نوع، آیتم، E، N، ردیف‌های PMS، جدید؟)
+        """
+        self.changes_model.set_rows(rows)
 
 
 # ================================================================================
@@ -1111,13 +1497,12 @@ class AboutTab(QWidget):
         title_label = QLabel("🎨 PMS Auto-Updater")
         title_label.setObjectName("titleLabel")
         title_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        title_label.setStyleSheet("font-size: 20pt; font-weight: bold; color: #007acc;")
         layout.addWidget(title_label)
 
         # نسخه
         version_label = QLabel("نسخه 1.0.0")
+        version_label.setObjectName("versionLabel")
         version_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        version_label.setStyleSheet("font-size: 12pt; color: #d4d4d4;")
         layout.addWidget(version_label)
 
         # خط جداکننده
@@ -1127,16 +1512,9 @@ class AboutTab(QWidget):
         layout.addWidget(separator)
 
         # توضیحات
-        description = QLabel(
-            "سیستم به‌روزرسانی خودکار فایل PMS از PNT-G\n\n"
-            "✅ استخراج خودکار آیتم‌ها\n"
-            "✅ تطبیق هوشمند با ساختار سلسله‌مراتبی\n"
-            "✅ درج و آپدیت خودکار\n"
-            "✅ Cache برای سرعت بالا\n"
-            "✅ رابط کاربری PyQt6"
-        )
+        description = QLabel(_DESC_TEXT)
+        description.setObjectName("descLabel")
         description.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        description.setStyleSheet("font-size: 10pt; line-height: 1.6;")
         layout.addWidget(description)
 
         # خط جداکننده
@@ -1146,13 +1524,9 @@ class AboutTab(QWidget):
         layout.addWidget(separator2)
 
         # تیم توسعه
-        dev_label = QLabel(
-            "💻 توسعه‌دهنده: Hossein Izadi"
-            "📅 تاریخ: 1404/09/09\n"
-            "🔧  Python 3.11 | PyQt6 | openpyxl | win32com"
-        )
+        dev_label = QLabel(_DEV_TEXT)
+        dev_label.setObjectName("devLabel")
         dev_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        dev_label.setStyleSheet("font-size: 9pt; color: #808080;")
         layout.addWidget(dev_label)
 
         layout.addStretch()
@@ -1161,16 +1535,9 @@ class AboutTab(QWidget):
         help_group = QGroupBox("📖 راهنمای سریع")
         help_layout = QVBoxLayout()
 
-        help_text = QLabel(
-            "1️⃣ فایل PMS و PNT را انتخاب کنید\n"
-            "2️⃣ شیت‌های مورد نظر را تعیین کنید\n"
-            "3️⃣ تنظیمات را بررسی کنید (محدوده محورها، Cache)\n"
-            "4️⃣ برای تست ابتدا Dry Run را فعال کنید\n"
-            "5️⃣ دکمه 'شروع پردازش' را بزنید\n"
-            "6️⃣ نتایج را در تب 'گزارش‌ها' مشاهده کنید"
-        )
+        help_text = QLabel(_HELP_TEXT)
+        help_text.setObjectName("helpText")
         help_text.setWordWrap(True)
-        help_text.setStyleSheet("font-size: 9pt; line-height: 1.8;")
         help_layout.addWidget(help_text)
 
         help_group.setLayout(help_layout)
@@ -1204,15 +1571,9 @@ class MainWindow(QMainWindow):
         """بارگذاری تنظیمات"""
         # اولویت 1: config.json
         # اولویت 2: config.env
-
-        # اگه هیچکدوم نبود، PMSConfig خودش خطا میده
-        if os.path.exists("config.json"):
-            return PMSConfig("config.json")
-        elif os.path.exists("config.env"):
-            return PMSConfig("config.env")
-        else:
-            # پیش‌فرض config.json (خطا میده اگه نباشه)
-            return PMSConfig("config.json")
+        # (ConfigLoader خودش در نبود config.json سراغ config.env می‌رود
+        #  و اگه هیچکدوم نبود خطا میده؛ بررسی جداگانه وجود فایل لازم نیست)
+        return PMSConfig("config.json")
 
     def init_ui(self):
         """ساخت رابط کاربری"""
@@ -1227,31 +1588,30 @@ class MainWindow(QMainWindow):
         self.tabs = QTabWidget()
 
         self.execute_tab = ExecuteTab(self)
-        self.reports_tab = ReportsTab()
-        self.changes_tab = ChangesTab()
-        self.about_tab = AboutTab()
-
         self.tabs.addTab(self.execute_tab, "▶️ اجرا")
-        self.tabs.addTab(self.reports_tab, "📊 گزارش‌ها")
-        self.tabs.addTab(self.changes_tab, "🔄 تغییرات")
-        self.tabs.addTab(self.about_tab, "ℹ️ درباره")
+
+        # بقیه تب‌ها در اولین نمایش (یا اولین استفاده) ساخته می‌شوند
+        self._lazy_tabs: Dict[int, type] = {}
+        self._tab_index: Dict[type, int] = {}
+        for factory, title in ((ReportsTab, "📊 گزارش‌ها"),
+                               (ChangesTab, "🔄 تغییرات"),
+                               (AboutTab, "ℹ️ درباره")):
+            index = self.tabs.addTab(QWidget(), title)
+            self._lazy_tabs[index] = factory
+            self._tab_index[factory] = index
+
+        self.tabs.currentChanged.connect(self._materialize_tab)
 
         main_layout.addWidget(self.tabs)
 
         # کنسول (پایین صفحه)
-        console_label = QLabel("📟 کنسول:")
+        console_label = QLabel("📟 کنسول (راست‌کلیک برای پاک کردن):")
         console_label.setStyleSheet("font-weight: bold; margin-top: 10px;")
         main_layout.addWidget(console_label)
 
         self.console = ConsoleWidget()
         main_layout.addWidget(self.console)
 
-        # دکمه پاک کردن کنسول
-        clear_console_btn = QPushButton("🧹 پاک کردن کنسول")
-        clear_console_btn.setMaximumWidth(150)
-        clear_console_btn.clicked.connect(self.console.clear_console)
-        main_layout.addWidget(clear_console_btn)
-
         central_widget.setLayout(main_layout)
 
         # پیام خوش‌آمدگویی
@@ -1259,16 +1619,65 @@ class MainWindow(QMainWindow):
         self.console.append_message(f"📂 فایل PMS: {self.config.PMS_FILE}", "info")
         self.console.append_message(f"📂 فایل PNT: {self.config.PNT_FILE}", "info")
 
+    def _materialize_tab(self, index: int) -> QWidget:
+        """
+        ساخت تب واقعی به جای placeholder (فقط بار اول)
+
+        Args:
+            index: اندیس تب
+
+        Returns:
+            ویجت تب
+        """
+        factory = self._lazy_tabs.pop(index, None)
+        if factory is None:
+            return self.tabs.widget(index)
+
+        placeholder = self.tabs.widget(index)
+        title = self.tabs.tabText(index)
+        current_index = self.tabs.currentIndex()
+
+        widget = factory()
+
+        # جایگزینی بدون ترایگر شدن دوباره currentChanged
+        self.tabs.blockSignals(True)
+        self.tabs.removeTab(index)
+        self.tabs.insertTab(index, widget, title)
+        self.tabs.setCurrentIndex(current_index)
+        self.tabs.blockSignals(False)
+
+        placeholder.deleteLater()
+        return widget
+
+    @property
+    def reports_tab(self) -> 'ReportsTab':
+        return self._materialize_tab(self._tab_index[ReportsTab])
+
+    @property
+    def changes_tab(self) -> 'ChangesTab':
+        return self._materialize_tab(self._tab_index[ChangesTab])
+
+    @property
+    def about_tab(self) -> 'AboutTab':
+        return self._materialize_tab(self._tab_index[AboutTab])
+
     def restore_settings(self):
         """بازیابی تنظیمات ذخیره شده"""
-        geometry = self.settings.value("geometry")
-        if geometry:
+        # درخواست مستقیم QByteArray (بدون تبدیل عمومی QVariant و بررسی truthy)
+        geometry = self.settings.value("geometry", QByteArray(), type=QByteArray)
+        if not geometry.isEmpty():
             self.restoreGeometry(geometry)
 
+        # برای جلوگیری از نوشتن دوباره همان مقدار هنگام بستن
+        self._saved_geometry = geometry
+
     def closeEvent(self, event):
         """هنگام بستن پنجره"""
-        # ذخیره تنظیمات
-        self.settings.setValue("geometry", self.saveGeometry())
+        # ذخیره تنظیمات (فقط در صورت تغییر) و یک sync در انتها
+        geometry = self.saveGeometry()
+        if geometry != self._saved_geometry:
+            self.settings.setValue("geometry", geometry)
+            self.settings.sync()
         event.accept()
 
 
@@ -1278,14 +1687,31 @@ class MainWindow(QMainWindow):
 
 def main():
     """تابع اصلی برنامه"""
+    # traceback خطاها در فایل لاگ ذخیره می‌شود (در اجرای بدون کنسول stderr وجود ندارد)
+    logging.basicConfig(filename=LOG_FILE, encoding="utf-8", level=logging.WARNING,
+                        format="%(asctime)s %(levelname)s %(name)s: %(message)s")
+
+    # اگر ویجتی native شود، هم‌سطح‌هایش native نشوند (باید قبل از ساخت QApplication تنظیم شود)
+    QApplication.setAttribute(Qt.ApplicationAttribute.AA_DontCreateNativeWidgetSiblings, True)
+
     app = QApplication(sys.argv)
 
+    # نمایش splash قبل از پارس stylesheet و ساخت پنجره (اولین تصویر زودتر دیده می‌شود)
+    splash_pixmap = QPixmap(360, 120)
+    splash_pixmap.fill(QColor("#1e1e1e"))
+    splash = QSplashScreen(splash_pixmap)
+    splash.showMessage("🎨 PMS Auto-Updater\nدر حال بارگذاری...",
+                       Qt.AlignmentFlag.AlignCenter, QColor("#d4d4d4"))
+    splash.show()
+    app.processEvents()
+
     # اعمال Dark Theme
     app.setStyleSheet(DARK_STYLESHEET)
 
     # پنجره اصلی
     window = MainWindow()
     window.show()
+    splash.finish(window)
 
     sys.exit(app.exec())
 